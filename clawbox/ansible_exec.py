@@ -78,6 +78,8 @@ def run_ansible_shell(
             cwd=ansible_dir,
             check=False,
             text=True,
+            encoding="utf-8",
+            errors="replace",
             capture_output=True,
             env=build_ansible_env(),
         )
@@ -2,15 +2,24 @@ from __future__ import annotations
 
 import os
 import tempfile
+import time
 from pathlib import Path
 
+_TAIL_BLOCK_SIZE = 8192
+# Coarsest common mtime tick (FAT); a rewrite within one tick can keep mtime, size and a reused inode.
+_RACY_MTIME_NS = 2_000_000_000
+
 
 def atomic_write_text(path: Path, content: str) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.tmp-", dir=str(path.parent))
     try:
-        with os.fdopen(fd, "w", encoding="utf-8") as handle:
-            handle.write(content)
+        try:
+            data = memoryview(content.encode("utf-8"))
+            while data:
+                data = data[os.write(fd, data) :]
+        finally:
+            os.close(fd)
         Path(tmp_name).replace(path)
     finally:
         try:
@@ -26,8 +35,33 @@ def read_text_or_empty(path: Path) -> str:
         return ""
 
 
+def settled_stat_key(stat: os.stat_result) -> tuple[int, int, int] | None:
+    # A recently modified file can still change without its stat changing, so it gets no cache key.
+    if time.time_ns() - stat.st_mtime_ns < _RACY_MTIME_NS:
+        return None
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
 def tail_lines(path: Path, count: int = 20) -> str:
-    if not path.exists():
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
         return ""
-    lines = path.read_text(encoding="utf-8", errors="replace").splitlines()
+    # Read backwards from EOF so large logs cost only their last few blocks.
+    chunks: list[bytes] = []
+    newlines = 0
+    try:
+        pos = os.fstat(fd).st_size
+        while pos > 0 and newlines <= count:
+            size = min(_TAIL_BLOCK_SIZE, pos)
+            pos -= size
+            chunk = os.pread(fd, size, pos)
+            chunks.append(chunk)
+            newlines += chunk.count(b"\n")
+    except OSError:
+        # Keep whatever tail was read before the error (e.g. a directory fails on the first read).
+        pass
+    finally:
+        os.close(fd)
+    lines = b"".join(reversed(chunks)).decode("utf-8", errors="replace").splitlines()
     return "\n".join(lines[-count:])
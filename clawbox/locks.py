@@ -6,6 +6,7 @@ import shutil
 import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
 from clawbox.io_utils import atomic_write_text, read_text_or_empty
@@ -59,9 +60,13 @@ def _canonical_path(path: str) -> Path:
     return Path(path).expanduser().resolve()
 
 
+@lru_cache(maxsize=64)
+def _lock_key(canonical_path: str) -> str:
+    return hashlib.sha256(canonical_path.encode("utf-8")).hexdigest()
+
+
 def _lock_dir_for(spec: LockSpec, canonical_path: Path) -> Path:
-    key = hashlib.sha256(str(canonical_path).encode("utf-8")).hexdigest()
-    return _lock_root(spec) / key
+    return _lock_root(spec) / _lock_key(str(canonical_path))
 
 
 def _write_metadata(lock_dir: Path, spec: LockSpec, canonical_path: Path, vm_name: str) -> None:
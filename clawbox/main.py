@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+from functools import lru_cache
 from pathlib import Path
 
 from clawbox.cli import (
@@ -291,8 +292,13 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+@lru_cache(maxsize=1)
+def _cached_parser() -> argparse.ArgumentParser:
+    return build_parser()
+
+
 def parse_args() -> argparse.Namespace:
-    parser = build_parser()
+    parser = _cached_parser()
     args = parser.parse_args()
 
     if args.command in {"up", "recreate"}:
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import json
+import os
 import re
 import shutil
 import subprocess
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 from clawbox.io_utils import atomic_write_text, read_text_or_empty
@@ -34,7 +36,12 @@ class SessionSpec:
 
 
 def mutagen_available() -> bool:
-    return shutil.which("mutagen") is not None
+    return _mutagen_on_path(os.environ.get("PATH", os.defpath))
+
+
+@lru_cache(maxsize=4)
+def _mutagen_on_path(search_path: str) -> bool:
+    return shutil.which("mutagen", path=search_path) is not None
 
 
 def _run_mutagen(
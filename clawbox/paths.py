@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 PACKAGE_ROOT = Path(__file__).resolve().parents[1]
@@ -10,6 +11,7 @@ STATE_DIR_ENV = "CLAWBOX_STATE_DIR"
 SECRETS_FILE_ENV = "CLAWBOX_SECRETS_FILE"
 
 
+@lru_cache(maxsize=16)
 def _has_required_project_files(root: Path) -> bool:
     return (root / "ansible" / "playbooks" / "provision.yml").exists() and (
         root / "packer" / "macos-base.pkr.hcl"
@@ -17,20 +19,24 @@ def _has_required_project_files(root: Path) -> bool:
 
 
 def resolve_data_root() -> Path:
-    env_root = os.getenv(DATA_ROOT_ENV)
+    return _resolve_data_root(os.getenv(DATA_ROOT_ENV) or "", PACKAGE_ROOT, sys.prefix)
+
+
+@lru_cache(maxsize=4)
+def _resolve_data_root(env_root: str, package_root: Path, prefix: str) -> Path:
     if env_root:
         candidate = Path(env_root).expanduser()
         if _has_required_project_files(candidate):
             return candidate
 
-    if _has_required_project_files(PACKAGE_ROOT):
-        return PACKAGE_ROOT
+    if _has_required_project_files(package_root):
+        return package_root
 
-    prefix_candidate = Path(sys.prefix) / "share" / "clawbox"
+    prefix_candidate = Path(prefix) / "share" / "clawbox"
     if _has_required_project_files(prefix_candidate):
         return prefix_candidate
 
-    return PACKAGE_ROOT
+    return package_root
 
 
 def _prefer_repo_local_paths(data_root: Path) -> bool:
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import time
+from typing import Callable
+
+
+def poll_until(
+    predicate: Callable[[], bool],
+    timeout_seconds: float,
+    *,
+    initial: float = 0.05,
+    cap: float = 1.0,
+    factor: float = 2.0,
+    final_check: bool = False,
+) -> bool:
+    deadline = time.monotonic() + timeout_seconds
+    delay = min(initial, cap)
+    while time.monotonic() < deadline:
+        attempt_started = time.monotonic()
+        if predicate():
+            return True
+        now = time.monotonic()
+        remaining = deadline - now
+        if remaining <= 0:
+            # The predicate just ran at the deadline; a final check would repeat it back-to-back.
+            return False
+        step = min(delay - (now - attempt_started), remaining)
+        if step > 0:
+            time.sleep(step)
+        delay = min(cap, delay * factor)
+    return final_check and predicate()
@@ -1,14 +1,40 @@
 from __future__ import annotations
 
 import argparse
-import re
 import sys
 from pathlib import Path
 
 from clawbox.release_meta import ReleaseMetaError, validate_version_tag
 
 
-SHA256_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+_FORMULA_TEMPLATE = """\
+class Clawbox < Formula
+  include Language::Python::Virtualenv
+
+  desc "Provision and manage Clawbox macOS VMs with Tart"
+  homepage "https://github.com/joshavant/clawbox"
+  url "{url}"
+  sha256 "{sha256}"
+  version "{version}"
+  license "MIT"
+  head "https://github.com/joshavant/clawbox.git", branch: "main"
+
+  depends_on "python@3.12"
+  depends_on "ansible"
+  depends_on "hashicorp/tap/packer"
+  depends_on "cirruslabs/cli/tart"
+  depends_on "mutagen-io/mutagen/mutagen"
+
+  def install
+    virtualenv_install_with_resources
+  end
+
+  test do
+    output = shell_output("#{{bin}}/clawbox --help")
+    assert_match "Clawbox macOS VM orchestration", output
+  end
+end
+"""
 
 
 class ReleaseFormulaError(RuntimeError):
@@ -17,9 +43,15 @@ class ReleaseFormulaError(RuntimeError):
 
 def validate_sha256(value: str) -> str:
     normalized = value.strip().lower()
-    if not SHA256_PATTERN.fullmatch(normalized):
-        raise ReleaseFormulaError(f"Invalid sha256 '{value}'. Expected 64 lowercase hex characters.")
-    return normalized
+    # bytes.fromhex skips whitespace between byte pairs, so require a contiguous token.
+    if len(normalized) == 64 and normalized.isalnum():
+        try:
+            bytes.fromhex(normalized)
+        except ValueError:
+            pass
+        else:
+            return normalized
+    raise ReleaseFormulaError(f"Invalid sha256 '{value}'. Expected 64 lowercase hex characters.")
 
 
 def render_formula(version_tag: str, sha256: str) -> str:
@@ -32,34 +64,7 @@ def render_formula(version_tag: str, sha256: str) -> str:
     archive = f"clawbox-{version}.tar.gz"
     url = f"https://github.com/joshavant/clawbox/releases/download/{validated_tag}/{archive}"
 
-    return (
-        "class Clawbox < Formula\n"
-        "  include Language::Python::Virtualenv\n"
-        "\n"
-        "  desc \"Provision and manage Clawbox macOS VMs with Tart\"\n"
-        "  homepage \"https://github.com/joshavant/clawbox\"\n"
-        f"  url \"{url}\"\n"
-        f"  sha256 \"{validated_sha}\"\n"
-        f"  version \"{version}\"\n"
-        "  license \"MIT\"\n"
-        "  head \"https://github.com/joshavant/clawbox.git\", branch: \"main\"\n"
-        "\n"
-        "  depends_on \"python@3.12\"\n"
-        "  depends_on \"ansible\"\n"
-        "  depends_on \"hashicorp/tap/packer\"\n"
-        "  depends_on \"cirruslabs/cli/tart\"\n"
-        "  depends_on \"mutagen-io/mutagen/mutagen\"\n"
-        "\n"
-        "  def install\n"
-        "    virtualenv_install_with_resources\n"
-        "  end\n"
-        "\n"
-        "  test do\n"
-        "    output = shell_output(\"#{bin}/clawbox --help\")\n"
-        "    assert_match \"Clawbox macOS VM orchestration\", output\n"
-        "  end\n"
-        "end\n"
-    )
+    return _FORMULA_TEMPLATE.format_map({"url": url, "sha256": validated_sha, "version": version})
 
 
 def update_formula_file(formula_path: Path, version_tag: str, sha256: str) -> None:
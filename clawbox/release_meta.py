@@ -3,9 +3,14 @@ from __future__ import annotations
 import argparse
 import re
 import sys
+from itertools import takewhile
 from pathlib import Path
 
 VERSION_TAG_PATTERN = re.compile(r"^v(\d+)\.(\d+)\.(\d+)$")
+PROJECT_SECTION_PATTERN = re.compile(
+    r"^[^\S\n]*\[project\][^\S\n]*$(.*?)(?=^[^\S\n]*\[|\Z)", re.M | re.S
+)
+PROJECT_VERSION_PATTERN = re.compile(r'^[^\S\n]*version\s*=\s*"([^"]+)"', re.M)
 
 
 class ReleaseMetaError(RuntimeError):
@@ -25,42 +30,25 @@ def expected_project_version(version_tag: str) -> str:
 
 def read_project_version(pyproject_path: Path) -> str:
     content = pyproject_path.read_text(encoding="utf-8")
-    in_project_section = False
-    for raw_line in content.splitlines():
-        line = raw_line.strip()
-        if not line or line.startswith("#"):
-            continue
-        if line.startswith("[") and line.endswith("]"):
-            in_project_section = line == "[project]"
-            continue
-        if in_project_section and line.startswith("version"):
-            match = re.match(r'version\s*=\s*"([^"]+)"', line)
-            if match:
-                return match.group(1)
-            break
+    section = PROJECT_SECTION_PATTERN.search(content)
+    if section:
+        match = PROJECT_VERSION_PATTERN.search(section.group(1))
+        if match:
+            return match.group(1)
     raise ReleaseMetaError(f"Could not read [project].version from {pyproject_path}")
 
 
 def extract_changelog_section(version_tag: str, changelog_path: Path) -> str:
     heading = f"## {version_tag}"
-    lines = changelog_path.read_text(encoding="utf-8").splitlines()
-
-    start_index: int | None = None
-    for idx, line in enumerate(lines):
-        if line.strip() == heading:
-            start_index = idx
-            break
-
-    if start_index is None:
-        raise ReleaseMetaError(f"Missing changelog section heading: {heading}")
-
-    end_index = len(lines)
-    for idx in range(start_index + 1, len(lines)):
-        if lines[idx].startswith("## "):
-            end_index = idx
-            break
-
-    section = "\n".join(lines[start_index:end_index]).strip()
+    with changelog_path.open(encoding="utf-8") as handle:
+        for line in handle:
+            if line.strip() == heading:
+                break
+        else:
+            raise ReleaseMetaError(f"Missing changelog section heading: {heading}")
+        lines = [line, *takewhile(lambda next_line: not next_line.startswith("## "), handle)]
+
+    section = "".join(lines).strip()
     if not section:
         raise ReleaseMetaError(f"Changelog section for {version_tag} is empty")
     return section + "\n"
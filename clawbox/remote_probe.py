@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 import subprocess
-import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Callable, Sequence
 
 from clawbox.ansible_exec import run_ansible_shell
+from clawbox.polling import poll_until
 
 
 @dataclass(frozen=True)
@@ -92,14 +92,16 @@ def wait_for_remote_probe(
     context: RemoteShellContext | None = None,
     become: bool = False,
     inventory_path: str | None = None,
-    poll_seconds: int = 2,
+    poll_seconds: float = 5.0,
     shell_runner: Callable[..., subprocess.CompletedProcess[str]] | None = None,
 ) -> tuple[bool, dict[str, str], str]:
-    waited = 0
+    # Each probe is a full SSH round trip, so probes start at most every poll_seconds.
     last_statuses = {path: "unknown" for path in paths}
     last_error = ""
-    while waited < timeout_seconds:
-        returncode, statuses, probe_error = run_remote_path_probe(
+
+    def _probe_once() -> bool:
+        nonlocal last_statuses, last_error
+        returncode, last_statuses, last_error = run_remote_path_probe(
             target,
             shell_cmd=shell_cmd,
             paths=paths,
@@ -111,11 +113,9 @@ def wait_for_remote_probe(
             inventory_path=inventory_path,
             shell_runner=shell_runner,
         )
-        last_statuses = statuses
-        last_error = probe_error
-        if is_success(returncode, statuses):
-            return True, last_statuses, last_error
-        time.sleep(poll_seconds)
-        waited += poll_seconds
+        return is_success(returncode, last_statuses)
 
-    return False, last_statuses, last_error
+    succeeded = poll_until(
+        _probe_once, timeout_seconds, initial=poll_seconds, cap=poll_seconds, factor=1.0
+    )
+    return succeeded, last_statuses, last_error
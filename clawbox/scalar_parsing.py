@@ -1,32 +1,32 @@
 from __future__ import annotations
 
+import re
+from functools import lru_cache
+
+# Quoted runs (an unterminated quote runs to end of line) or a bare comment marker.
+_INLINE_TOKEN_RE = re.compile(r"""'[^']*'?|"[^"]*"?|#""")
+
+
+@lru_cache(maxsize=32)
+def _scalar_line_re(key: str) -> re.Pattern[str]:
+    return re.compile(rf"^\s*{re.escape(key)}:(.*)$", re.MULTILINE)
+
 
 def strip_inline_comment(value: str) -> str:
-    in_single = False
-    in_double = False
-    for idx, ch in enumerate(value):
-        if ch == "'" and not in_double:
-            in_single = not in_single
-        elif ch == '"' and not in_single:
-            in_double = not in_double
-        elif ch == "#" and not in_single and not in_double:
-            return value[:idx]
+    for match in _INLINE_TOKEN_RE.finditer(value):
+        if match.group() == "#":
+            return value[: match.start()]
     return value
 
 
 def parse_scalar(text: str, key: str) -> str:
-    prefix = f"{key}:"
-    for raw_line in text.splitlines():
-        line = raw_line.strip()
-        if not line or line.startswith("#"):
-            continue
-        if not line.startswith(prefix):
-            continue
-
-        raw_value = strip_inline_comment(line[len(prefix) :]).strip()
-        if not raw_value:
-            return ""
-        if len(raw_value) >= 2 and raw_value[0] == raw_value[-1] and raw_value[0] in {'"', "'"}:
-            return raw_value[1:-1].strip()
-        return raw_value
-    return ""
+    match = _scalar_line_re(key).search(text)
+    if match is None:
+        return ""
+
+    raw_value = strip_inline_comment(match.group(1)).strip()
+    if not raw_value:
+        return ""
+    if len(raw_value) >= 2 and raw_value[0] == raw_value[-1] and raw_value[0] in {'"', "'"}:
+        return raw_value[1:-1].strip()
+    return raw_value
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 
+from clawbox.io_utils import settled_stat_key
 from clawbox.scalar_parsing import parse_scalar
 
 DEFAULT_VM_PASSWORD = "clawbox"
@@ -40,7 +42,19 @@ def parse_vm_password(text: str) -> str | None:
 
 
 def read_vm_password(path: Path) -> str:
-    value = parse_vm_password(path.read_text(encoding="utf-8"))
+    key = settled_stat_key(path.stat())
+    if key is None:
+        return _read_vm_password_uncached(str(path))
+    return _read_vm_password_cached(str(path), *key)
+
+
+@lru_cache(maxsize=8)
+def _read_vm_password_cached(path: str, _mtime_ns: int, _size: int, _inode: int) -> str:
+    return _read_vm_password_uncached(path)
+
+
+def _read_vm_password_uncached(path: str) -> str:
+    value = parse_vm_password(Path(path).read_text(encoding="utf-8"))
     if not value:
         raise ValueError(f"Error: Could not parse vm_password from {path}")
     return value
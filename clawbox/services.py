@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import AbstractSet
 
 
 @dataclass(frozen=True)
@@ -44,24 +46,23 @@ def enabled_optional_service_keys(
     enable_playwright: bool,
     enable_tailscale: bool,
     enable_signal_cli: bool,
-) -> set[str]:
-    enabled: set[str] = set()
-    if enable_playwright:
-        enabled.add(SERVICE_PLAYWRIGHT)
-    if enable_tailscale:
-        enabled.add(SERVICE_TAILSCALE)
-    if enable_signal_cli:
-        enabled.add(SERVICE_SIGNAL_CLI)
-    return enabled
+) -> frozenset[str]:
+    return _enabled_keys(bool(enable_playwright), bool(enable_tailscale), bool(enable_signal_cli))
 
 
-def unsupported_optional_services(profile: str, enabled_keys: set[str]) -> list[OptionalServiceSpec]:
-    unsupported: list[OptionalServiceSpec] = []
-    for key in sorted(enabled_keys):
-        spec = OPTIONAL_SERVICE_BY_KEY.get(key)
-        if spec is None:
-            continue
-        if profile not in spec.allowed_profiles:
-            unsupported.append(spec)
-    return unsupported
+@lru_cache(maxsize=8)
+def _enabled_keys(playwright: bool, tailscale: bool, signal_cli: bool) -> frozenset[str]:
+    flags = {SERVICE_PLAYWRIGHT: playwright, SERVICE_TAILSCALE: tailscale, SERVICE_SIGNAL_CLI: signal_cli}
+    return frozenset(key for key, enabled in flags.items() if enabled)
 
+
+@lru_cache(maxsize=8)
+def _unsupported_keys_for_profile(profile: str) -> frozenset[str]:
+    return frozenset(spec.key for spec in OPTIONAL_SERVICES if profile not in spec.allowed_profiles)
+
+
+def unsupported_optional_services(profile: str, enabled_keys: AbstractSet[str]) -> list[OptionalServiceSpec]:
+    unsupported_keys = _unsupported_keys_for_profile(profile)
+    if not unsupported_keys:
+        return []
+    return [OPTIONAL_SERVICE_BY_KEY[key] for key in sorted(unsupported_keys.intersection(enabled_keys))]
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
+from clawbox.io_utils import atomic_write_text, settled_stat_key
 
-@dataclass
+
+@dataclass(frozen=True)
 class ProvisionMarker:
     vm_name: str
     profile: str
@@ -18,50 +21,56 @@ class ProvisionMarker:
 
     @classmethod
     def from_file(cls, marker_file: Path) -> "ProvisionMarker | None":
-        if not marker_file.exists():
+        try:
+            key = settled_stat_key(marker_file.stat())
+        except FileNotFoundError:
             return None
-        data: dict[str, str] = {}
-        for line in marker_file.read_text(encoding="utf-8").splitlines():
-            if ":" not in line:
-                continue
-            key, value = line.split(":", 1)
-            data[key.strip()] = value.strip()
+        if key is None:
+            return cls.from_text(marker_file.read_text(encoding="utf-8"))
+        return _read_marker_cached(str(marker_file), *key)
+
+    @classmethod
+    def from_text(cls, text: str) -> "ProvisionMarker | None":
+        data = {
+            key.strip(): value.strip()
+            for key, sep, value in (line.partition(":") for line in text.splitlines())
+            if sep
+        }
         if not data:
             return None
-
-        def b(name: str) -> bool:
-            return data.get(name, "false") == "true"
-
         return cls(
             vm_name=data.get("vm_name", ""),
             profile=data.get("profile", ""),
-            playwright=b("playwright"),
-            tailscale=b("tailscale"),
-            signal_cli=b("signal_cli"),
-            signal_payload=b("signal_payload"),
+            playwright=data.get("playwright") == "true",
+            tailscale=data.get("tailscale") == "true",
+            signal_cli=data.get("signal_cli") == "true",
+            signal_payload=data.get("signal_payload") == "true",
             sync_backend=data.get("sync_backend", ""),
             provisioned_at=data.get("provisioned_at", ""),
         )
 
     def write(self, marker_file: Path) -> None:
-        marker_file.parent.mkdir(parents=True, exist_ok=True)
-        marker_file.write_text(
-            "\n".join(
-                [
-                    f"vm_name: {self.vm_name}",
-                    f"profile: {self.profile}",
-                    f"playwright: {'true' if self.playwright else 'false'}",
-                    f"tailscale: {'true' if self.tailscale else 'false'}",
-                    f"signal_cli: {'true' if self.signal_cli else 'false'}",
-                    f"signal_payload: {'true' if self.signal_payload else 'false'}",
-                    f"sync_backend: {self.sync_backend}",
-                    f"provisioned_at: {self.provisioned_at}",
-                ]
-            )
-            + "\n",
-            encoding="utf-8",
+        atomic_write_text(
+            marker_file,
+            f"vm_name: {self.vm_name}\n"
+            f"profile: {self.profile}\n"
+            f"playwright: {_flag(self.playwright)}\n"
+            f"tailscale: {_flag(self.tailscale)}\n"
+            f"signal_cli: {_flag(self.signal_cli)}\n"
+            f"signal_payload: {_flag(self.signal_payload)}\n"
+            f"sync_backend: {self.sync_backend}\n"
+            f"provisioned_at: {self.provisioned_at}\n",
         )
 
 
+def _flag(value: bool) -> str:
+    return "true" if value else "false"
+
+
+@lru_cache(maxsize=32)
+def _read_marker_cached(path: str, _mtime_ns: int, _size: int, _inode: int) -> ProvisionMarker | None:
+    return ProvisionMarker.from_text(Path(path).read_text(encoding="utf-8"))
+
+
 def current_utc_timestamp() -> str:
-    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
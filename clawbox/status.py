@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import json
-import re
+import os
 import shlex
 import subprocess
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Literal, Sequence
+from typing import Iterable, Literal, Sequence
 
 from clawbox.auth import vm_user_credentials
 from clawbox.config import vm_base_name, vm_name_for
@@ -20,10 +21,15 @@ MountProbeState = Literal["not_applicable", "ok", "unavailable"]
 SignalProbeState = Literal["not_applicable"]
 MutagenProbeState = Literal["not_applicable", "ok", "unavailable"]
 
-_MOUNT_STATUS_RE = re.compile(r"['\"]?(?P<path>.+?)['\"]?=(?P<status>mounted|dir|missing|ok)")
+_STATUS_MAX_WORKERS = 8
+_QUOTES = ("'", '"')
+_MUTAGEN_NO_SESSIONS = "No synchronization sessions found"
+_MUTAGEN_SUMMARY_PREFIXES = ("Name: ", "Status: ")
+_MUTAGEN_SUMMARY_LINES = 6
+_STATUS_TOKENS = ("mounted", "dir", "missing", "ok")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StatusContext:
     ansible_dir: Path
     state_dir: Path
@@ -35,35 +41,47 @@ class StatusContext:
     ansible_command_timeout_seconds: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ProvisionMarkerReport:
     present: bool
     data: dict[str, object] | None
 
+    def as_dict(self) -> dict[str, object]:
+        return {"present": self.present, "data": self.data}
+
 
-@dataclass
+@dataclass(slots=True)
 class SyncPathsReport:
     note: str | None = None
     probe: MountProbeState = "not_applicable"
     paths: dict[str, str] = field(default_factory=dict)
 
+    def as_dict(self) -> dict[str, object]:
+        return {"note": self.note, "probe": self.probe, "paths": self.paths}
+
 
-@dataclass
+@dataclass(slots=True)
 class SignalPayloadSyncReport:
     enabled: bool
     probe: SignalProbeState = "not_applicable"
     lines: list[str] = field(default_factory=list)
 
+    def as_dict(self) -> dict[str, object]:
+        return {"enabled": self.enabled, "probe": self.probe, "lines": self.lines}
+
 
-@dataclass
+@dataclass(slots=True)
 class MutagenSyncReport:
     enabled: bool
     probe: MutagenProbeState = "not_applicable"
     active: bool | None = None
     lines: list[str] = field(default_factory=list)
 
+    def as_dict(self) -> dict[str, object]:
+        return {"enabled": self.enabled, "probe": self.probe, "active": self.active, "lines": self.lines}
+
 
-@dataclass
+@dataclass(slots=True)
 class VMStatusReport:
     vm: str
     exists: bool
@@ -78,72 +96,80 @@ class VMStatusReport:
     warnings: list[str] = field(default_factory=list)
 
     def as_dict(self) -> dict[str, object]:
-        sync_paths_payload = {
-            "note": self.sync_paths.note,
-            "probe": self.sync_paths.probe,
-            "paths": self.sync_paths.paths,
-        }
         return {
             "vm": self.vm,
             "exists": self.exists,
             "running": self.running,
-            "provision_marker": {
-                "present": self.provision_marker.present,
-                "data": self.provision_marker.data,
-            },
+            "provision_marker": self.provision_marker.as_dict(),
             "ip": self.ip,
-            "sync_paths": sync_paths_payload,
-            "signal_payload_sync": {
-                "enabled": self.signal_payload_sync.enabled,
-                "probe": self.signal_payload_sync.probe,
-                "lines": self.signal_payload_sync.lines,
-            },
-            "mutagen_sync": {
-                "enabled": self.mutagen_sync.enabled,
-                "probe": self.mutagen_sync.probe,
-                "active": self.mutagen_sync.active,
-                "lines": self.mutagen_sync.lines,
-            },
+            "sync_paths": self.sync_paths.as_dict(),
+            "signal_payload_sync": self.signal_payload_sync.as_dict(),
+            "mutagen_sync": self.mutagen_sync.as_dict(),
             "warnings": self.warnings,
         }
 
 
 def build_mount_status_command(mount_paths: Sequence[str]) -> str:
-    clauses: list[str] = []
-    for path in mount_paths:
-        quoted_path = shlex.quote(path)
-        mount_probe = shlex.quote(f" on {path} (")
-        clauses.append(
-            "if /sbin/mount | /usr/bin/grep -F -- "
-            f"{mount_probe} >/dev/null 2>&1; then "
-            f"printf '%s=%s\\n' {quoted_path} mounted; "
-            f"elif [ -d {quoted_path} ]; then "
-            f"printf '%s=%s\\n' {quoted_path} dir; "
-            f"else printf '%s=%s\\n' {quoted_path} missing; fi"
-        )
-    return "; ".join(clauses)
+    return _build_mount_status_command(tuple(mount_paths))
+
+
+@lru_cache(maxsize=8)
+def _build_mount_status_command(mount_paths: tuple[str, ...]) -> str:
+    # Capture the mount table once; each path is then a shell `case` match plus one test.
+    quoted_paths = " ".join(shlex.quote(path) for path in mount_paths)
+    return (
+        "m=$(/sbin/mount 2>/dev/null); "
+        f"for p in {quoted_paths}; do "
+        'case "$m" in '
+        "*\" on $p (\"*) printf '%s=%s\\n' \"$p\" mounted ;; "
+        "*) if [ -d \"$p\" ]; then printf '%s=%s\\n' \"$p\" dir; "
+        "else printf '%s=%s\\n' \"$p\" missing; fi ;; "
+        "esac; done"
+    )
 
 
 def parse_mount_statuses(stdout: str, mount_paths: Sequence[str]) -> dict[str, str]:
     statuses = {path: "unknown" for path in mount_paths}
-    mount_status_tokens = ("mounted", "dir", "missing", "ok")
+    unresolved = len(statuses)
+
+    def _set(path: str, status: str) -> None:
+        nonlocal unresolved
+        if statuses[path] == "unknown":
+            unresolved -= 1
+        statuses[path] = status
+
+    def _assign(candidate: str) -> bool:
+        path_part, sep, status_part = candidate.rpartition("=")
+        if not sep:
+            return False
+        path = path_part.strip()
+        if path[:1] in _QUOTES:
+            path = path[1:]
+        if path[-1:] in _QUOTES:
+            path = path[:-1]
+        status = status_part.strip()
+        if path in statuses and status in _STATUS_TOKENS:
+            _set(path, status)
+            return True
+        return False
+
+    # Later lines still overwrite earlier ones; scanning stops once every path has a status.
     for raw in stdout.splitlines():
+        if not unresolved:
+            break
         line = raw.strip()
-        if not line:
+        if "=" not in line or not any(path in line for path in statuses):
             continue
-
-        for match in _MOUNT_STATUS_RE.finditer(line):
-            path = match.group("path").strip().strip("'\"")
-            status = match.group("status")
-            if path in statuses:
-                statuses[path] = status
-
-        for path in mount_paths:
-            if statuses[path] != "unknown":
-                continue
-            for status in mount_status_tokens:
+        # The emitter prints one `path=status` per line; wrapped output falls back to tokens.
+        if _assign(line):
+            continue
+        for token in line.split():
+            _assign(token)
+        # A path containing spaces is split by the token pass; match it in place instead.
+        for path in [path for path, status in statuses.items() if status == "unknown" and path in line]:
+            for status in _STATUS_TOKENS:
                 if f"{path}={status}" in line:
-                    statuses[path] = status
+                    _set(path, status)
                     break
     return statuses
 
@@ -211,7 +237,7 @@ def _status_probe_auth(
 
 def _status_report_base(
     vm_name: str,
-    marker_file: Path,
+    marker_present: bool,
     marker: ProvisionMarker | None,
     exists: bool,
     running: bool,
@@ -231,7 +257,7 @@ def _status_report_base(
         exists=exists,
         running=running,
         provision_marker=ProvisionMarkerReport(
-            present=marker_file.exists(),
+            present=marker_present,
             data=marker_data,
         ),
         signal_payload_sync=SignalPayloadSyncReport(enabled=bool(marker and marker.signal_payload)),
@@ -242,16 +268,22 @@ def _status_report_base(
 
 
 def _summarize_mutagen_status(status_output: str) -> tuple[bool, list[str]]:
-    lines = [line.strip() for line in status_output.splitlines() if line.strip()]
-    filtered = [line for line in lines if set(line) != {"-"}]
+    filtered: list[str] = []
+    session_summary: list[str] = []
+    for raw in status_output.splitlines():
+        line = raw.strip()
+        # Skip blank lines and mutagen's dashed separators.
+        if not line.strip("-"):
+            continue
+        if _MUTAGEN_NO_SESSIONS in line:
+            return False, ["no active sessions found"]
+        if len(filtered) < _MUTAGEN_SUMMARY_LINES:
+            filtered.append(line)
+        if len(session_summary) < _MUTAGEN_SUMMARY_LINES and line.startswith(_MUTAGEN_SUMMARY_PREFIXES):
+            session_summary.append(line)
     if not filtered:
         return False, ["no active sessions found"]
-    if any("No synchronization sessions found" in line for line in filtered):
-        return False, ["no active sessions found"]
-    session_summary = [line for line in filtered if line.startswith("Name: ") or line.startswith("Status: ")]
-    if session_summary:
-        return True, session_summary[:6]
-    return True, filtered[:6]
+    return True, session_summary or filtered
 
 
 def _probe_mutagen_sync(vm_name: str) -> tuple[MutagenProbeState, bool | None, list[str]]:
@@ -307,55 +339,64 @@ def _probe_sync_paths(
     return "ok", parsed_statuses
 
 
-def _render_status_report_text(
+def _format_status_report_text(
     vm_name: str,
-    marker_file: Path,
     marker: ProvisionMarker | None,
     report: VMStatusReport,
-) -> None:
-    print(f"VM: {vm_name}")
-    print(f"  exists: {'yes' if report.exists else 'no'}")
-    print(f"  running: {'yes' if report.running else 'no'}")
-    print(f"  provision marker: {'present' if marker_file.exists() else 'missing'}")
+) -> str:
+    lines = [
+        f"VM: {vm_name}",
+        f"  exists: {'yes' if report.exists else 'no'}",
+        f"  running: {'yes' if report.running else 'no'}",
+        f"  provision marker: {'present' if report.provision_marker.present else 'missing'}",
+    ]
     if marker:
-        print(
+        lines.append(
             "  marker profile/playwright/tailscale/signal_cli/signal_payload/sync_backend: "
             f"{marker.profile}/{str(marker.playwright).lower()}/{str(marker.tailscale).lower()}/"
             f"{str(marker.signal_cli).lower()}/{str(marker.signal_payload).lower()}/"
             f"{marker.sync_backend or '(missing)'}"
         )
     if report.warnings:
-        print("  warnings:")
+        lines.append("  warnings:")
         for warning in report.warnings:
-            print(f"    - {warning}")
+            lines.append(f"    - {warning}")
 
     if not report.exists:
-        return
+        return "\n".join(lines)
 
-    print(f"  ip: {report.ip if report.ip else '(unavailable)'}")
+    lines.append(f"  ip: {report.ip if report.ip else '(unavailable)'}")
     if not report.running or not report.ip:
-        return
+        return "\n".join(lines)
 
     if report.sync_paths.note:
-        print(f"  note: {report.sync_paths.note}")
+        lines.append(f"  note: {report.sync_paths.note}")
 
     if report.sync_paths.probe == "unavailable":
-        print("  sync paths: unavailable (remote probe failed)")
+        lines.append("  sync paths: unavailable (remote probe failed)")
     elif report.sync_paths.probe == "ok":
-        print("  sync paths:")
+        lines.append("  sync paths:")
         for path, status in report.sync_paths.paths.items():
-            print(f"    - {path}: {status}")
+            lines.append(f"    - {path}: {status}")
 
     if report.mutagen_sync.enabled:
         if report.mutagen_sync.probe == "unavailable":
-            print("  mutagen sync: unavailable")
+            lines.append("  mutagen sync: unavailable")
         elif report.mutagen_sync.probe == "ok":
             state = "active" if report.mutagen_sync.active else "inactive"
-            print(f"  mutagen sync: {state}")
+            lines.append(f"  mutagen sync: {state}")
         for line in report.mutagen_sync.lines:
-            print(f"    - {line}")
+            lines.append(f"    - {line}")
 
-    return
+    return "\n".join(lines)
+
+
+def _render_status_report_text(
+    vm_name: str,
+    marker: ProvisionMarker | None,
+    report: VMStatusReport,
+) -> None:
+    print(_format_status_report_text(vm_name, marker, report))
 
 
 def _build_vm_status_report(
@@ -363,13 +404,15 @@ def _build_vm_status_report(
     tart: TartClient,
     *,
     context: StatusContext,
-) -> tuple[Path, ProvisionMarker | None, VMStatusReport]:
+) -> tuple[ProvisionMarker | None, VMStatusReport]:
     marker_file = context.state_dir / f"{vm_name}.provisioned"
     marker = ProvisionMarker.from_file(marker_file)
+    # A parsed marker implies the file exists; only an unreadable one needs a second stat.
+    marker_present = marker is not None or marker_file.exists()
     exists = tart.vm_exists(vm_name)
     running = tart.vm_running(vm_name) if exists else False
 
-    report = _status_report_base(vm_name, marker_file, marker, exists, running)
+    report = _status_report_base(vm_name, marker_present, marker, exists, running)
     if exists:
         report.ip = tart.ip(vm_name)
 
@@ -393,10 +436,10 @@ def _build_vm_status_report(
         creds, warnings = _status_probe_auth(vm_name, marker, context)
         report.warnings.extend(warnings)
         if not mount_paths:
-            return marker_file, marker, report
+            return marker, report
         if creds is None:
             report.sync_paths.probe = "unavailable"
-            return marker_file, marker, report
+            return marker, report
         mount_probe, mount_statuses = _probe_sync_paths(
             vm_name,
             mount_paths,
@@ -407,11 +450,10 @@ def _build_vm_status_report(
         report.sync_paths.probe = mount_probe
         report.sync_paths.paths = mount_statuses
 
-    return marker_file, marker, report
+    return marker, report
 
 
-def _parse_vm_suffix_number(vm_name: str, base_name: str) -> int | None:
-    prefix = f"{base_name}-"
+def _parse_vm_suffix_number(vm_name: str, prefix: str) -> int | None:
     if not vm_name.startswith(prefix):
         return None
     suffix = vm_name[len(prefix) :]
@@ -423,49 +465,67 @@ def _parse_vm_suffix_number(vm_name: str, base_name: str) -> int | None:
     return value
 
 
-def _candidate_vm_names(tart: TartClient, context: StatusContext) -> list[str]:
-    base_name = vm_base_name()
-    names: set[str] = set()
+def _candidate_vm_names(
+    tart: TartClient,
+    context: StatusContext,
+    vms: Iterable[dict[str, object]] | None = None,
+) -> list[str]:
+    prefix = f"{vm_base_name()}-"
+    numbers: dict[str, int] = {}
 
-    for vm in tart.list_vms_json():
+    def _consider(vm_name: str) -> None:
+        number = _parse_vm_suffix_number(vm_name, prefix)
+        if number is not None:
+            numbers[vm_name] = number
+
+    for vm in tart.list_vms_json() if vms is None else vms:
         name = vm.get("Name")
-        if not isinstance(name, str):
-            continue
-        if _parse_vm_suffix_number(name, base_name) is not None:
-            names.add(name)
-
-    if context.state_dir.exists():
-        for marker_file in context.state_dir.glob(f"{base_name}-*.provisioned"):
-            vm_name = marker_file.name.removesuffix(".provisioned")
-            if _parse_vm_suffix_number(vm_name, base_name) is not None:
-                names.add(vm_name)
-
-    return sorted(
-        names,
-        key=lambda name: (_parse_vm_suffix_number(name, base_name) or 10**9, name),
-    )
+        if isinstance(name, str):
+            _consider(name)
+
+    # Marker-only VMs must still be listed, so the state dir is always scanned; a
+    # name-filtered scandir avoids glob's pattern translation and the exists() stat.
+    try:
+        with os.scandir(context.state_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith(prefix) and entry.name.endswith(".provisioned"):
+                    _consider(entry.name.removesuffix(".provisioned"))
+    except (FileNotFoundError, NotADirectoryError):
+        pass
+
+    return [name for _, name in sorted((number, name) for name, number in numbers.items())]
 
 
 def status_vm(vm_number: int, tart: TartClient, *, as_json: bool, context: StatusContext) -> None:
     vm_name = vm_name_for(vm_number)
-    marker_file, marker, report = _build_vm_status_report(vm_name, tart, context=context)
+    marker, report = _build_vm_status_report(vm_name, tart, context=context)
 
     if as_json:
         print(json.dumps(report.as_dict(), indent=2))
         return
 
-    _render_status_report_text(vm_name, marker_file, marker, report)
+    _render_status_report_text(vm_name, marker, report)
 
 
 def status_environment(tart: TartClient, *, as_json: bool, context: StatusContext) -> None:
-    vm_names = _candidate_vm_names(tart, context)
+    # Discovery takes the client's `tart list` snapshot, which the per-VM exists/running checks reuse.
+    vm_names = _candidate_vm_names(tart, context, tart.list_snapshot().values())
     reports: list[VMStatusReport] = []
-    marker_files: dict[str, Path] = {}
     markers: dict[str, ProvisionMarker | None] = {}
 
-    for vm_name in vm_names:
-        marker_file, marker, report = _build_vm_status_report(vm_name, tart, context=context)
-        marker_files[vm_name] = marker_file
+    def _build(vm_name: str) -> tuple[ProvisionMarker | None, VMStatusReport]:
+        return _build_vm_status_report(vm_name, tart, context=context)
+
+    # Each report blocks on tart and ansible subprocesses, so probe VMs concurrently.
+    if len(vm_names) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(_STATUS_MAX_WORKERS, len(vm_names))) as pool:
+            results = list(pool.map(_build, vm_names))
+    else:
+        results = [_build(vm_name) for vm_name in vm_names]
+
+    for vm_name, (marker, report) in zip(vm_names, results):
         markers[vm_name] = marker
         reports.append(report)
 
@@ -479,19 +539,11 @@ def status_environment(tart: TartClient, *, as_json: bool, context: StatusContex
         print(json.dumps(payload, indent=2))
         return
 
-    print("Clawbox environment:")
-    print(f"  vms discovered: {len(reports)}")
-
+    parts = ["Clawbox environment:", f"  vms discovered: {len(reports)}"]
     if not reports:
-        print("  no Clawbox VMs found.")
-        print("  run `clawbox up` to create and provision one.")
-        return
-
+        parts.append("  no Clawbox VMs found.")
+        parts.append("  run `clawbox up` to create and provision one.")
     for report in reports:
-        print("")
-        _render_status_report_text(
-            report.vm,
-            marker_files[report.vm],
-            markers[report.vm],
-            report,
-        )
+        parts.append("")
+        parts.append(_format_status_report_text(report.vm, markers[report.vm], report))
+    print("\n".join(parts))
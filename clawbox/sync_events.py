@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import json
 import os
-from datetime import datetime, timezone
+import time
 from pathlib import Path
 from typing import Any, Mapping
 
@@ -10,10 +10,11 @@ _SYNC_EVENT_LOG_MAX_BYTES_ENV = "CLAWBOX_SYNC_EVENT_LOG_MAX_BYTES"
 _DEFAULT_SYNC_EVENT_LOG_MAX_BYTES = 5 * 1024 * 1024
 _SYNC_EVENT_LOG_FILE = "sync-events.jsonl"
 _SYNC_EVENT_LOG_ROTATED_FILE = "sync-events.jsonl.1"
+_EVENT_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"))
 
 
 def _timestamp() -> str:
-    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
 
 
 def _max_log_size_bytes() -> int:
@@ -38,9 +39,11 @@ def _rotated_log_path(state_dir: Path) -> Path:
 
 
 def _maybe_rotate(path: Path, rotated: Path) -> None:
-    if not path.exists():
+    try:
+        size = path.stat().st_size
+    except FileNotFoundError:
         return
-    if path.stat().st_size < _max_log_size_bytes():
+    if size < _max_log_size_bytes():
         return
     rotated.unlink(missing_ok=True)
     path.replace(rotated)
@@ -59,7 +62,6 @@ def emit_sync_event(
     try:
         path = _log_path(state_dir)
         rotated = _rotated_log_path(state_dir)
-        path.parent.mkdir(parents=True, exist_ok=True)
         _maybe_rotate(path, rotated)
 
         payload: dict[str, Any] = {
@@ -71,9 +73,15 @@ def emit_sync_event(
         }
         if details:
             payload["details"] = dict(details)
-        encoded = (json.dumps(payload, sort_keys=True, separators=(",", ":")) + "\n").encode("utf-8")
+        encoded = (_EVENT_ENCODER.encode(payload) + "\n").encode("utf-8")
 
-        fd = os.open(path, os.O_APPEND | os.O_CREAT | os.O_WRONLY, 0o600)
+        flags = os.O_APPEND | os.O_CREAT | os.O_WRONLY | os.O_CLOEXEC
+        try:
+            fd = os.open(path, flags, 0o600)
+        except FileNotFoundError:
+            # Only the first event for a state dir needs to create the logs directory.
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(path, flags, 0o600)
         try:
             os.write(fd, encoded)
         finally:
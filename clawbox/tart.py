@@ -1,17 +1,35 @@
 from __future__ import annotations
 
 import json
+import os
 import subprocess
 import time
+from enum import Enum
 from pathlib import Path
 from typing import Any
 
+from clawbox.polling import poll_until
+
 
 class TartError(RuntimeError):
     """Raised when a tart command fails in an orchestration-sensitive way."""
 
 
+_LIST_SNAPSHOT_TTL_SECONDS = 0.5
+TART_HOME_ENV = "TART_HOME"
+
+
+def tart_vm_dir(vm_name: str) -> Path:
+    tart_home = os.getenv(TART_HOME_ENV)
+    root = Path(tart_home).expanduser() if tart_home else Path.home() / ".tart"
+    return root / "vms" / vm_name
+
+
 class TartClient:
+    def __init__(self) -> None:
+        self._snapshot: dict[str, dict[str, Any]] | None = None
+        self._snapshot_taken_at = 0.0
+
     def _run(
         self,
         args: list[str],
@@ -57,27 +75,43 @@ class TartClient:
             raise TartError("Unexpected tart list payload: expected a JSON list")
         return data
 
+    def list_snapshot(self) -> dict[str, dict[str, Any]]:
+        # One `tart list` serves back-to-back exists/running checks; mutating calls invalidate it.
+        now = time.monotonic()
+        if self._snapshot is None or now - self._snapshot_taken_at > _LIST_SNAPSHOT_TTL_SECONDS:
+            snapshot: dict[str, dict[str, Any]] = {}
+            for vm in self.list_vms_json():
+                name = vm.get("Name")
+                if isinstance(name, str):
+                    snapshot[name] = vm
+            self._snapshot = snapshot
+            self._snapshot_taken_at = now
+        return self._snapshot
+
+    def invalidate(self) -> None:
+        self._snapshot = None
+
     def vm_exists(self, vm_name: str) -> bool:
-        for vm in self.list_vms_json():
-            if vm.get("Name") == vm_name:
-                return True
-        return False
+        return vm_name in self.list_snapshot()
 
     def vm_running(self, vm_name: str) -> bool:
-        for vm in self.list_vms_json():
-            if vm.get("Name") == vm_name:
-                running = vm.get("Running")
-                return bool(running) if isinstance(running, bool) else False
-        return False
+        vm = self.list_snapshot().get(vm_name)
+        if vm is None:
+            return False
+        running = vm.get("Running")
+        return bool(running) if isinstance(running, bool) else False
 
     def clone(self, base_image: str, vm_name: str) -> None:
         self._run(["tart", "clone", base_image, vm_name], check=True, capture_output=False)
+        self.invalidate()
 
     def stop(self, vm_name: str) -> None:
         self._run(["tart", "stop", vm_name], check=False)
+        self.invalidate()
 
     def delete(self, vm_name: str) -> None:
         self._run(["tart", "delete", vm_name], check=False)
+        self.invalidate()
 
     def ip(self, vm_name: str) -> str | None:
         for args in (
@@ -109,16 +143,28 @@ class TartClient:
             raise TartError(f"Error: Could not start tart run for '{vm_name}': {exc}") from exc
         finally:
             log_handle.close()
+        self.invalidate()
         return proc
 
 
+class VmState(Enum):
+    ABSENT = "absent"
+    STOPPED = "stopped"
+    RUNNING = "running"
+
+
+def classify_vm_state(tart: TartClient, vm_name: str) -> VmState:
+    if not tart.vm_exists(vm_name):
+        return VmState.ABSENT
+    return VmState.RUNNING if tart.vm_running(vm_name) else VmState.STOPPED
+
+
 def wait_for_vm_running(
-    tart: TartClient, vm_name: str, timeout_seconds: int, poll_seconds: int = 1
+    tart: TartClient, vm_name: str, timeout_seconds: int, poll_seconds: float = 1
 ) -> bool:
-    waited = 0
-    while waited < timeout_seconds:
-        if tart.vm_running(vm_name):
-            return True
-        time.sleep(poll_seconds)
-        waited += poll_seconds
-    return tart.vm_running(vm_name)
+    def _running() -> bool:
+        # Each attempt must see a fresh `tart list`; the snapshot TTL is for back-to-back checks.
+        tart.invalidate()
+        return tart.vm_running(vm_name)
+
+    return poll_until(_running, timeout_seconds, cap=poll_seconds, final_check=True)
@@ -2,13 +2,13 @@ from __future__ import annotations
 
 import json
 import os
-import shlex
+import select
 import signal
 import subprocess
 import sys
 import time
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
 from clawbox.io_utils import atomic_write_text, read_text_or_empty, tail_lines
@@ -23,9 +23,10 @@ class WatcherError(RuntimeError):
 
 
 _VM_STOP_CONFIRMATION_POLLS = 3
+_RECORD_ENCODER = json.JSONEncoder(sort_keys=True)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WatcherRecord:
     vm_name: str
     pid: int
@@ -46,17 +47,23 @@ def _watcher_log_path(state_dir: Path, vm_name: str) -> Path:
 
 
 def _timestamp() -> str:
-    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
 
 
 def _atomic_write_json(path: Path, payload: dict[str, object]) -> None:
-    atomic_write_text(path, json.dumps(payload, sort_keys=True) + "\n")
+    atomic_write_text(path, _RECORD_ENCODER.encode(payload) + "\n")
 
 
 def _read_record(path: Path) -> WatcherRecord | None:
     raw = read_text_or_empty(path)
     if not raw:
         return None
+    return _parse_record(raw)
+
+
+# Keyed on the record text: a stat key can repeat across a same-size rewrite on coarse-mtime filesystems.
+@lru_cache(maxsize=32)
+def _parse_record(raw: str) -> WatcherRecord | None:
     try:
         payload = json.loads(raw)
     except json.JSONDecodeError:
@@ -98,9 +105,22 @@ def _pid_running(pid: int) -> bool:
     return True
 
 
+def _proc_cmdline(pid: int) -> str | None:
+    try:
+        raw = Path(f"/proc/{pid}/cmdline").read_bytes()
+    except OSError:
+        return None
+    args = [arg.decode("utf-8", errors="replace") for arg in raw.split(b"\0") if arg]
+    return " ".join(args) if args else None
+
+
 def _pid_cmdline(pid: int) -> str:
     if not _pid_running(pid):
         return ""
+    # Linux exposes argv directly; elsewhere (macOS) fall back to forking ps.
+    cmdline = _proc_cmdline(pid)
+    if cmdline is not None:
+        return cmdline
     try:
         proc = subprocess.run(
             ["ps", "-o", "command=", "-p", str(pid)],
@@ -119,13 +139,52 @@ def _is_watcher_pid(pid: int, vm_name: str) -> bool:
     cmd = _pid_cmdline(pid)
     if not cmd:
         return False
-    try:
-        parts = set(shlex.split(cmd))
-    except ValueError:
-        return "_watch-vm" in cmd and vm_name in cmd
+    # Like `ps -o command=`, the command line is argv joined by spaces, unquoted.
+    parts = cmd.split()
     return "_watch-vm" in parts and vm_name in parts
 
 
+def _block_until_pid_exit(pid: int, timeout_seconds: float) -> bool:
+    # Returns False when the platform offers no exit notification to block on.
+    try:
+        if hasattr(select, "kqueue"):
+            queue = select.kqueue()
+            try:
+                event = select.kevent(
+                    pid,
+                    filter=select.KQ_FILTER_PROC,
+                    flags=select.KQ_EV_ADD | select.KQ_EV_ONESHOT,
+                    fflags=select.KQ_NOTE_EXIT,
+                )
+                queue.control([event], 1, timeout_seconds)
+            finally:
+                queue.close()
+            return True
+        if hasattr(os, "pidfd_open"):
+            pidfd = os.pidfd_open(pid)
+            try:
+                poller = select.poll()
+                poller.register(pidfd, select.POLLIN)
+                poller.poll(timeout_seconds * 1000)
+            finally:
+                os.close(pidfd)
+            return True
+    except OSError:
+        return False
+    return False
+
+
+def _wait_for_pid_exit(pid: int, timeout_seconds: float) -> bool:
+    deadline = time.monotonic() + max(timeout_seconds, 0)
+    if timeout_seconds > 0 and _pid_running(pid) and _block_until_pid_exit(pid, timeout_seconds):
+        return not _pid_running(pid)
+    while time.monotonic() < deadline:
+        if not _pid_running(pid):
+            break
+        time.sleep(0.1)
+    return not _pid_running(pid)
+
+
 def _signal_watcher_pid(pid: int, sig: signal.Signals) -> None:
     if pid <= 0:
         return
@@ -139,6 +198,10 @@ def _signal_watcher_pid(pid: int, sig: signal.Signals) -> None:
         return
     except OSError:
         pass
+    else:
+        # Watchers lead their own session, so the group signal already reached them.
+        if pgid == pid:
+            return
     try:
         os.kill(pid, sig)
     except ProcessLookupError:
@@ -209,8 +272,12 @@ def start_vm_watcher(state_dir: Path, vm_name: str, *, poll_seconds: int = 2) ->
     finally:
         log_handle.close()
 
-    time.sleep(0.15)
-    if proc.poll() is not None:
+    # Returns as soon as a broken watcher exits instead of always sleeping out the grace period.
+    try:
+        proc.wait(timeout=0.15)
+    except subprocess.TimeoutExpired:
+        pass
+    else:
         msg = [f"Error: watcher failed to start for '{vm_name}'."]
         tail = tail_lines(log_file)
         if tail:
@@ -230,24 +297,34 @@ def start_vm_watcher(state_dir: Path, vm_name: str, *, poll_seconds: int = 2) ->
     return proc.pid
 
 
-def stop_vm_watcher(state_dir: Path, vm_name: str, *, timeout_seconds: int = 5) -> bool:
-    record_path = _watcher_record_path(state_dir, vm_name)
-    record = _read_record(record_path)
-    if record is None:
+def _stop_watcher_records(records: list[tuple[Path, WatcherRecord]], timeout_seconds: float) -> None:
+    # Signal every watcher first so they all shut down within one shared deadline.
+    pids = [record.pid for _, record in records if _is_watcher_pid(record.pid, record.vm_name)]
+    for pid in pids:
+        _signal_watcher_pid(pid, signal.SIGTERM)
+    deadline = time.monotonic() + timeout_seconds
+    for pid in pids:
+        if not _wait_for_pid_exit(pid, max(deadline - time.monotonic(), 0)):
+            _signal_watcher_pid(pid, signal.SIGKILL)
+    for record_path, _ in records:
         record_path.unlink(missing_ok=True)
-        return False
 
-    if _is_watcher_pid(record.pid, vm_name):
-        _signal_watcher_pid(record.pid, signal.SIGTERM)
-        deadline = time.monotonic() + max(timeout_seconds, 0)
-        while time.monotonic() < deadline:
-            if not _pid_running(record.pid):
-                break
-            time.sleep(0.1)
-        if _pid_running(record.pid):
-            _signal_watcher_pid(record.pid, signal.SIGKILL)
-    record_path.unlink(missing_ok=True)
-    return True
+
+def stop_vm_watchers(state_dir: Path, vm_names: list[str], *, timeout_seconds: int = 5) -> list[str]:
+    records: list[tuple[Path, WatcherRecord]] = []
+    for vm_name in vm_names:
+        record_path = _watcher_record_path(state_dir, vm_name)
+        record = _read_record(record_path)
+        if record is None:
+            record_path.unlink(missing_ok=True)
+            continue
+        records.append((record_path, record))
+    _stop_watcher_records(records, timeout_seconds)
+    return [record.vm_name for _, record in records]
+
+
+def stop_vm_watcher(state_dir: Path, vm_name: str, *, timeout_seconds: int = 5) -> bool:
+    return bool(stop_vm_watchers(state_dir, [vm_name], timeout_seconds=timeout_seconds))
 
 
 def reconcile_vm_watchers(tart: TartClient, state_dir: Path) -> None:
@@ -257,24 +334,36 @@ def reconcile_vm_watchers(tart: TartClient, state_dir: Path) -> None:
         except TartError:
             return None
 
-    watchers_dir = _watchers_dir(state_dir)
-    if not watchers_dir.exists():
+    try:
+        with os.scandir(_watchers_dir(state_dir)) as entries:
+            record_paths = [Path(entry.path) for entry in entries if entry.name.endswith(".json")]
+    except (FileNotFoundError, NotADirectoryError):
         return
-    for record_path in watchers_dir.glob("*.json"):
+    records: list[tuple[Path, WatcherRecord]] = []
+    for record_path in record_paths:
         record = _read_record(record_path)
         if record is None:
             record_path.unlink(missing_ok=True)
             continue
+        records.append((record_path, record))
+
+    # Query every VM before stopping any watcher: stops can outlast the tart list
+    # snapshot TTL, and this way a single listing answers the whole pass.
+    running_by_vm = {name: _vm_running(name) for name in {record.vm_name for _, record in records}}
+    stale: list[str] = []
+    for record_path, record in records:
+        running = running_by_vm[record.vm_name]
         if not _pid_running(record.pid):
             record_path.unlink(missing_ok=True)
-            running = _vm_running(record.vm_name)
             if running is False:
                 cleanup_locks_for_vm(record.vm_name)
             continue
-        running = _vm_running(record.vm_name)
         if running is False:
-            stop_vm_watcher(state_dir, record.vm_name)
-            cleanup_locks_for_vm(record.vm_name)
+            stale.append(record.vm_name)
+    if stale:
+        stop_vm_watchers(state_dir, stale)
+        for vm_name in stale:
+            cleanup_locks_for_vm(vm_name)
 
 
 def run_vm_watcher_loop(
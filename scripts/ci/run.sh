@@ -110,7 +110,8 @@ run_logic() {
 	echo "==> logic tests"
 	local coverage_json
 	coverage_json="$(mktemp "${TMPDIR:-/tmp}/clawbox-logic-coverage.XXXXXX")"
-	python3 -m pytest -q tests/logic_py \
+	# This gate always runs the whole suite, so the --lf/--nf cache would never be read back.
+	python3 -m pytest -q -p no:cacheprovider tests/logic_py \
 		--cov=clawbox \
 		--cov-report=term-missing \
 		--cov-report="json:${coverage_json}" \
@@ -79,6 +79,8 @@ def test_run_ansible_shell_runs_with_expected_params(monkeypatch: pytest.MonkeyP
     assert kwargs["cwd"] == tmp_path
     assert kwargs["check"] is False
     assert kwargs["text"] is True
+    assert kwargs["encoding"] == "utf-8"
+    assert kwargs["errors"] == "replace"
     assert kwargs["capture_output"] is True
     assert kwargs["env"]["ANSIBLE_HOST_KEY_CHECKING"] == "False"
 
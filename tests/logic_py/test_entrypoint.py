@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import runpy
+import subprocess
+import sys
 
 from clawbox import main as main_module
 
@@ -10,3 +12,9 @@ def test_python_module_entrypoint_calls_main(monkeypatch):
     monkeypatch.setattr(main_module, "main", lambda: called.update(value=True))
     runpy.run_module("clawbox.__main__", run_name="__main__")
     assert called["value"] is True
+
+
+def test_cli_import_defers_concurrent_futures():
+    probe = "import sys, clawbox.main; print('concurrent.futures' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"
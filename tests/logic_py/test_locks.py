@@ -29,6 +29,17 @@ def _lock_dir_for_path(spec: lock_mod.LockSpec, path: Path, home: Path) -> Path:
     return home / ".clawbox" / "locks" / spec.lock_kind / key
 
 
+def test_lock_dir_follows_home_with_cached_key(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    source = tmp_path / "source"
+    spec = lock_mod.OPENCLAW_SOURCE_LOCK
+    lock_mod._lock_key.cache_clear()
+    for home in (tmp_path / "home-a", tmp_path / "home-b"):
+        monkeypatch.setenv("HOME", str(home))
+        assert lock_mod._lock_dir_for(spec, source.resolve()) == _lock_dir_for_path(spec, source, home)
+    info = lock_mod._lock_key.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
 def test_cleanup_other_locks_is_noop_when_root_missing(isolated_home: Path) -> None:
     keep = isolated_home / "keep"
     lock_mod._cleanup_other_locks_for_vm(lock_mod.OPENCLAW_SOURCE_LOCK, "clawbox-91", keep)
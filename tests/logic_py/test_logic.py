@@ -1,11 +1,9 @@
 from __future__ import annotations
 
 import hashlib
-import io
 import json
-import os
 import subprocess
-from contextlib import redirect_stdout
+from dataclasses import replace
 from pathlib import Path
 
 import pytest
@@ -19,6 +17,26 @@ from clawbox.orchestrator import ProvisionOptions, UpOptions, UserFacingError
 from clawbox.tart import TartError
 
 
+_DEFAULT_UP = UpOptions(
+    vm_number=91,
+    profile="standard",
+    openclaw_source="",
+    openclaw_payload="",
+    signal_payload="",
+    enable_playwright=False,
+    enable_tailscale=False,
+    enable_signal_cli=False,
+)
+_DEFAULT_PROVISION = ProvisionOptions(
+    vm_number=91,
+    profile="standard",
+    enable_playwright=False,
+    enable_tailscale=False,
+    enable_signal_cli=False,
+    enable_signal_payload=False,
+)
+
+
 class DummyProcess:
     def __init__(self, pid: int = 1234, poll_value: int | None = None):
         self.pid = pid
@@ -38,6 +56,9 @@ class FakeTart:
         self.delete_calls: list[str] = []
         self.next_proc = DummyProcess()
 
+    def invalidate(self) -> None:
+        pass
+
     def vm_exists(self, vm_name: str) -> bool:
         return self.exists.get(vm_name, False)
 
@@ -66,44 +87,83 @@ class FakeTart:
         return "192.168.64.10"
 
 
+class FakeRun:
+    def __init__(self):
+        self.calls: list[list[str]] = []
+        self.returncodes: dict[str, int] = {}
+
+    def __call__(self, args, **kwargs):
+        self.calls.append(list(args))
+        returncode = self.returncodes.get(args[0], 0) if args else 0
+        return subprocess.CompletedProcess(args=args, returncode=returncode, stdout="", stderr="")
+
+    def calls_to(self, program: str) -> list[list[str]]:
+        return [call for call in self.calls if call and call[0] == program]
+
+
 @pytest.fixture
+def tart() -> FakeTart:
+    return FakeTart()
+
+
+@pytest.fixture
+def running_vm(tart: FakeTart) -> str:
+    vm_name = "clawbox-91"
+    tart.exists[vm_name] = True
+    tart.running[vm_name] = True
+    return vm_name
+
+
+@pytest.fixture
+def no_locks(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(orchestrator, "_acquire_locks", lambda *_args, **_kwargs: None)
+
+
+@pytest.fixture
+def no_sleep(fake_clock: dict[str, float]) -> None:
+    pass
+
+
+@pytest.fixture
+def fake_run(monkeypatch: pytest.MonkeyPatch) -> FakeRun:
+    runner = FakeRun()
+    monkeypatch.setattr(orchestrator.subprocess, "run", runner)
+    return runner
+
+
+_ORCHESTRATOR_STUBS = {
+    "start_vm_watcher": lambda *_args, **_kwargs: 9999,
+    "stop_vm_watcher": lambda *_args, **_kwargs: False,
+    "mutagen_available": lambda: True,
+    "_activate_mutagen_sync": lambda **_kwargs: None,
+    "_activate_mutagen_sync_from_locks": lambda *_args, **_kwargs: None,
+    "_deactivate_mutagen_sync": lambda *_args, **_kwargs: None,
+}
+
+
+@pytest.fixture(autouse=True)
 def isolated_paths(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    # ANSIBLE_DIR, SECRETS_FILE and STATE_DIR are already isolated by conftest.py.
     monkeypatch.setattr(orchestrator, "PROJECT_DIR", tmp_path)
-    monkeypatch.setattr(orchestrator, "ANSIBLE_DIR", tmp_path / "ansible")
-    monkeypatch.setattr(orchestrator, "SECRETS_FILE", tmp_path / "ansible" / "secrets.yml")
-    monkeypatch.setattr(orchestrator, "STATE_DIR", tmp_path / ".clawbox" / "state")
-    monkeypatch.setattr(orchestrator, "start_vm_watcher", lambda *_args, **_kwargs: 9999)
-    monkeypatch.setattr(orchestrator, "stop_vm_watcher", lambda *_args, **_kwargs: False)
-    monkeypatch.setattr(orchestrator, "mutagen_available", lambda: True)
-    monkeypatch.setattr(orchestrator, "_activate_mutagen_sync", lambda **_kwargs: None)
-    monkeypatch.setattr(orchestrator, "_activate_mutagen_sync_from_locks", lambda *_args, **_kwargs: None)
-    monkeypatch.setattr(orchestrator, "_deactivate_mutagen_sync", lambda *_args, **_kwargs: None)
-    (tmp_path / "ansible").mkdir(parents=True, exist_ok=True)
+    for name, stub in _ORCHESTRATOR_STUBS.items():
+        monkeypatch.setattr(orchestrator, name, stub)
     yield tmp_path
 
 
-def capture_stdout(fn):
-    buf = io.StringIO()
-    with redirect_stdout(buf):
-        fn()
-    return buf.getvalue()
-
-
-def test_create_vm_success(isolated_paths):
-    tart = FakeTart()
-    out = capture_stdout(lambda: orchestrator.create_vm(91, tart))
+def test_create_vm_success(tart, capsys):
+    orchestrator.create_vm(91, tart)
+    out = capsys.readouterr().out
     assert tart.clone_calls == [(orchestrator.BASE_IMAGE, "clawbox-91")]
     assert "Created VM: clawbox-91" in out
 
 
-def test_create_vm_rejects_existing(isolated_paths):
-    tart = FakeTart()
+def test_create_vm_rejects_existing(tart):
     tart.exists["clawbox-91"] = True
     with pytest.raises(UserFacingError, match="already exists"):
         orchestrator.create_vm(91, tart)
 
 
-def test_create_vm_surfaces_virtualization_limit_hint(isolated_paths):
+def test_create_vm_surfaces_virtualization_limit_hint():
     class FailingTart(FakeTart):
         def clone(self, base_image: str, vm_name: str) -> None:
             raise TartError("Error Domain=VZErrorDomain Code=1")
@@ -119,29 +179,25 @@ def test_virtualization_hint_includes_tart_system_limit_phrase():
     assert "Virtualization.framework may be refusing another VM" in hinted
 
 
-def test_launch_vm_headless_passes_no_graphics(isolated_paths, monkeypatch):
-    tart = FakeTart()
+def test_launch_vm_headless_passes_no_graphics(tart, capsys, no_locks):
     tart.exists["clawbox-91"] = True
-    monkeypatch.setattr(orchestrator, "_acquire_locks", lambda *args, **kwargs: None)
-    out = capture_stdout(
-        lambda: orchestrator.launch_vm(
-            vm_number=91,
-            profile="standard",
-            openclaw_source="",
-            openclaw_payload="",
-            signal_payload="",
-            headless=True,
-            tart=tart,
-        )
+    orchestrator.launch_vm(
+        vm_number=91,
+        profile="standard",
+        openclaw_source="",
+        openclaw_payload="",
+        signal_payload="",
+        headless=True,
+        tart=tart,
     )
+    out = capsys.readouterr().out
     assert "launch mode:          headless" in out
-    assert tart.run_calls
+    assert len(tart.run_calls) == 1
     _, run_args, _ = tart.run_calls[0]
     assert "--no-graphics" in run_args
 
 
-def test_launch_vm_developer_requires_mounts(isolated_paths):
-    tart = FakeTart()
+def test_launch_vm_developer_requires_mounts(tart):
     with pytest.raises(UserFacingError, match="requires --openclaw-source and --openclaw-payload"):
         orchestrator.launch_vm(
             vm_number=91,
@@ -154,8 +210,7 @@ def test_launch_vm_developer_requires_mounts(isolated_paths):
         )
 
 
-def test_launch_vm_missing_vm_has_no_lock_or_marker_side_effects(isolated_paths, monkeypatch):
-    tart = FakeTart()
+def test_launch_vm_missing_vm_has_no_lock_or_marker_side_effects(isolated_paths, monkeypatch, tart):
     lock_calls: list[str] = []
     source_dir = isolated_paths / "source"
     payload_dir = isolated_paths / "payload"
@@ -185,11 +240,9 @@ def test_launch_vm_missing_vm_has_no_lock_or_marker_side_effects(isolated_paths,
     assert list(marker_dir.iterdir()) == []
 
 
-def test_launch_vm_surfaces_early_tart_exit(isolated_paths, monkeypatch):
-    tart = FakeTart()
+def test_launch_vm_surfaces_early_tart_exit(monkeypatch, tart, no_locks):
     tart.exists["clawbox-91"] = True
     tart.next_proc = DummyProcess(pid=4321, poll_value=1)
-    monkeypatch.setattr(orchestrator, "_acquire_locks", lambda *args, **kwargs: None)
     monkeypatch.setattr(orchestrator, "tail_lines", lambda *args, **kwargs: "simulated tart failure")
 
     with pytest.raises(UserFacingError, match="tart run exited before 'clawbox-91' reached a running state"):
@@ -204,10 +257,8 @@ def test_launch_vm_surfaces_early_tart_exit(isolated_paths, monkeypatch):
         )
 
 
-def test_launch_vm_surfaces_running_timeout(isolated_paths, monkeypatch):
-    tart = FakeTart()
+def test_launch_vm_surfaces_running_timeout(monkeypatch, tart, no_locks):
     tart.exists["clawbox-91"] = True
-    monkeypatch.setattr(orchestrator, "_acquire_locks", lambda *args, **kwargs: None)
     monkeypatch.setattr(orchestrator, "wait_for_vm_running", lambda *args, **kwargs: False)
     monkeypatch.setattr(orchestrator, "tail_lines", lambda *args, **kwargs: "simulated timeout")
 
@@ -223,11 +274,8 @@ def test_launch_vm_surfaces_running_timeout(isolated_paths, monkeypatch):
         )
 
 
-def test_launch_vm_running_vm_refreshes_lock_and_marker_work(isolated_paths, monkeypatch):
-    tart = FakeTart()
-    vm_name = "clawbox-91"
-    tart.exists[vm_name] = True
-    tart.running[vm_name] = True
+def test_launch_vm_running_vm_refreshes_lock_and_marker_work(isolated_paths, monkeypatch, tart, running_vm, capsys):
+    vm_name = running_vm
 
     source = isolated_paths / "source"
     payload = isolated_paths / "payload"
@@ -249,42 +297,30 @@ def test_launch_vm_running_vm_refreshes_lock_and_marker_work(isolated_paths, mon
         lambda *args, **kwargs: marker_calls.append("called"),
     )
 
-    out = capture_stdout(
-        lambda: orchestrator.launch_vm(
-            vm_number=91,
-            profile="developer",
-            openclaw_source=str(source),
-            openclaw_payload=str(payload),
-            signal_payload=str(signal),
-            headless=False,
-            tart=tart,
-        )
+    orchestrator.launch_vm(
+        vm_number=91,
+        profile="developer",
+        openclaw_source=str(source),
+        openclaw_payload=str(payload),
+        signal_payload=str(signal),
+        headless=False,
+        tart=tart,
     )
+    out = capsys.readouterr().out
     assert "VM 'clawbox-91' is already running." in out
     assert lock_calls == ["called"]
     assert marker_calls == ["called"]
 
 
-def test_up_standard_rejects_developer_flags(isolated_paths):
-    tart = FakeTart()
+def test_up_standard_rejects_developer_flags(tart):
     with pytest.raises(UserFacingError, match="only valid in developer mode"):
         orchestrator.up(
-            UpOptions(
-                vm_number=91,
-                profile="standard",
-                openclaw_source="/tmp/src",
-                openclaw_payload="/tmp/payload",
-                signal_payload="",
-                enable_playwright=False,
-                enable_tailscale=False,
-                enable_signal_cli=False,
-            ),
+            replace(_DEFAULT_UP, openclaw_source="/tmp/src", openclaw_payload="/tmp/payload"),
             tart,
         )
 
 
-def test_up_first_run_uses_headless_then_gui(isolated_paths, monkeypatch):
-    tart = FakeTart()
+def test_up_first_run_uses_headless_then_gui(monkeypatch, tart, capsys, no_locks):
     calls: list[str] = []
     orchestrator.ensure_secrets_file(create_if_missing=True)
 
@@ -317,27 +353,13 @@ def test_up_first_run_uses_headless_then_gui(isolated_paths, monkeypatch):
         )
         marker.write(orchestrator.STATE_DIR / "clawbox-91.provisioned")
 
-    monkeypatch.setattr(orchestrator, "_acquire_locks", lambda *args, **kwargs: None)
     monkeypatch.setattr(orchestrator, "create_vm", fake_create)
     monkeypatch.setattr(orchestrator, "launch_vm", fake_launch)
     monkeypatch.setattr(orchestrator, "provision_vm", fake_provision)
     monkeypatch.setattr(orchestrator, "wait_for_vm_running", lambda *args, **kwargs: True)
 
-    out = capture_stdout(
-        lambda: orchestrator.up(
-            UpOptions(
-                vm_number=91,
-                profile="standard",
-                openclaw_source="",
-                openclaw_payload="",
-                signal_payload="",
-                enable_playwright=False,
-                enable_tailscale=False,
-                enable_signal_cli=False,
-            ),
-            tart,
-        )
-    )
+    orchestrator.up(_DEFAULT_UP, tart)
+    out = capsys.readouterr().out
 
     assert calls == ["create:91", "launch:headless=true", "provision", "launch:headless=false"]
     assert "Clawbox is ready: clawbox-91" in out
@@ -345,8 +367,7 @@ def test_up_first_run_uses_headless_then_gui(isolated_paths, monkeypatch):
     assert "Wait for 'Clawbox is ready:' before logging in or editing synced files." not in out
 
 
-def test_up_first_run_developer_includes_sync_readiness_note(isolated_paths, monkeypatch):
-    tart = FakeTart()
+def test_up_first_run_developer_includes_sync_readiness_note(isolated_paths, monkeypatch, tart, capsys, no_locks):
     calls: list[str] = []
     orchestrator.ensure_secrets_file(create_if_missing=True)
 
@@ -380,28 +401,22 @@ def test_up_first_run_developer_includes_sync_readiness_note(isolated_paths, mon
         )
         marker.write(orchestrator.STATE_DIR / "clawbox-91.provisioned")
 
-    monkeypatch.setattr(orchestrator, "_acquire_locks", lambda *args, **kwargs: None)
     monkeypatch.setattr(orchestrator, "_preflight_developer_mounts", lambda *args, **kwargs: None)
     monkeypatch.setattr(orchestrator, "create_vm", fake_create)
     monkeypatch.setattr(orchestrator, "launch_vm", fake_launch)
     monkeypatch.setattr(orchestrator, "provision_vm", fake_provision)
     monkeypatch.setattr(orchestrator, "wait_for_vm_running", lambda *args, **kwargs: True)
 
-    out = capture_stdout(
-        lambda: orchestrator.up(
-            UpOptions(
-                vm_number=91,
-                profile="developer",
-                openclaw_source=str(isolated_paths),
-                openclaw_payload=str(isolated_paths),
-                signal_payload="",
-                enable_playwright=False,
-                enable_tailscale=False,
-                enable_signal_cli=False,
-            ),
-            tart,
-        )
+    orchestrator.up(
+        replace(
+            _DEFAULT_UP,
+            profile="developer",
+            openclaw_source=str(isolated_paths),
+            openclaw_payload=str(isolated_paths),
+        ),
+        tart,
     )
+    out = capsys.readouterr().out
 
     assert calls == ["create:91", "launch:headless=true", "provision", "launch:headless=false"]
     assert "Clawbox is ready: clawbox-91" in out
@@ -409,84 +424,43 @@ def test_up_first_run_developer_includes_sync_readiness_note(isolated_paths, mon
     assert "Wait for 'Clawbox is ready:' before logging in or editing synced files." in out
 
 
-def test_up_marker_match_skips_provision(isolated_paths, monkeypatch):
-    tart = FakeTart()
-    vm_name = "clawbox-91"
-    tart.exists[vm_name] = True
-    tart.running[vm_name] = True
+def _existing_standard_vm(vm_name: str, *, write_marker: bool = True) -> None:
     orchestrator.ensure_secrets_file(create_if_missing=True)
-    orchestrator.ProvisionMarker(
-        vm_name=vm_name,
-        profile="standard",
-        playwright=False,
-        tailscale=False,
-        signal_cli=False,
-        signal_payload=False,
-        provisioned_at="2026-01-01T00:00:00Z",
-    ).write(orchestrator.STATE_DIR / f"{vm_name}.provisioned")
-    monkeypatch.setattr(orchestrator, "_acquire_locks", lambda *args, **kwargs: None)
-
-    out = capture_stdout(
-        lambda: orchestrator.up(
-            UpOptions(
-                vm_number=91,
-                profile="standard",
-                openclaw_source="",
-                openclaw_payload="",
-                signal_payload="",
-                enable_playwright=False,
-                enable_tailscale=False,
-                enable_signal_cli=False,
-            ),
-            tart,
-        )
-    )
+    if write_marker:
+        orchestrator.ProvisionMarker(
+            vm_name=vm_name,
+            profile="standard",
+            playwright=False,
+            tailscale=False,
+            signal_cli=False,
+            signal_payload=False,
+            provisioned_at="2026-01-01T00:00:00Z",
+        ).write(orchestrator.STATE_DIR / f"{vm_name}.provisioned")
+
+
+def test_up_marker_match_skips_provision(tart, running_vm, capsys, no_locks):
+    _existing_standard_vm(running_vm)
+
+    orchestrator.up(_DEFAULT_UP, tart)
+    out = capsys.readouterr().out
     assert "Provision marker found for 'clawbox-91'; skipping provisioning." in out
     assert "Clawbox is running: clawbox-91 (provisioning skipped)" in out
 
 
-def test_up_marker_match_running_vm_does_not_reacquire_locks(isolated_paths, monkeypatch):
-    tart = FakeTart()
-    vm_name = "clawbox-91"
-    tart.exists[vm_name] = True
-    tart.running[vm_name] = True
-    orchestrator.ensure_secrets_file(create_if_missing=True)
-    orchestrator.ProvisionMarker(
-        vm_name=vm_name,
-        profile="standard",
-        playwright=False,
-        tailscale=False,
-        signal_cli=False,
-        signal_payload=False,
-        provisioned_at="2026-01-01T00:00:00Z",
-    ).write(orchestrator.STATE_DIR / f"{vm_name}.provisioned")
-
+def test_up_marker_match_running_vm_does_not_reacquire_locks(monkeypatch, tart, running_vm, capsys):
+    _existing_standard_vm(running_vm)
     monkeypatch.setattr(
         orchestrator,
         "_acquire_locks",
         lambda *args, **kwargs: (_ for _ in ()).throw(AssertionError("should not lock")),
     )
 
-    out = capture_stdout(
-        lambda: orchestrator.up(
-            UpOptions(
-                vm_number=91,
-                profile="standard",
-                openclaw_source="",
-                openclaw_payload="",
-                signal_payload="",
-                enable_playwright=False,
-                enable_tailscale=False,
-                enable_signal_cli=False,
-            ),
-            tart,
-        )
-    )
+    orchestrator.up(_DEFAULT_UP, tart)
+    out = capsys.readouterr().out
     assert "Clawbox is running: clawbox-91 (provisioning skipped)" in out
 
 
-def test_recreate_runs_down_delete_then_up(isolated_paths, monkeypatch):
-    tart = FakeTart()
+def test_recreate_runs_down_delete_then_up(isolated_paths, monkeypatch, tart, capsys):
     tart.exists["clawbox-93"] = True
     calls: list[str] = []
 
@@ -508,28 +482,24 @@ def test_recreate_runs_down_delete_then_up(isolated_paths, monkeypatch):
         ),
     )
 
-    out = capture_stdout(
-        lambda: orchestrator.recreate(
-            UpOptions(
-                vm_number=93,
-                profile="developer",
-                openclaw_source=str(isolated_paths),
-                openclaw_payload=str(isolated_paths),
-                signal_payload="",
-                enable_playwright=True,
-                enable_tailscale=False,
-                enable_signal_cli=False,
-            ),
-            tart,
-        )
+    orchestrator.recreate(
+        replace(
+            _DEFAULT_UP,
+            vm_number=93,
+            profile="developer",
+            openclaw_source=str(isolated_paths),
+            openclaw_payload=str(isolated_paths),
+            enable_playwright=True,
+        ),
+        tart,
     )
+    out = capsys.readouterr().out
 
     assert "Clean recreate requested for 'clawbox-93'." in out
     assert calls == ["down:93", "delete:93", "up:93:developer:true"]
 
 
-def test_recreate_missing_vm_runs_delete_then_up(isolated_paths, monkeypatch):
-    tart = FakeTart()
+def test_recreate_missing_vm_runs_delete_then_up(monkeypatch, tart):
     calls: list[str] = []
 
     monkeypatch.setattr(
@@ -549,85 +519,40 @@ def test_recreate_missing_vm_runs_delete_then_up(isolated_paths, monkeypatch):
     )
 
     orchestrator.recreate(
-        UpOptions(
-            vm_number=94,
-            profile="standard",
-            openclaw_source="",
-            openclaw_payload="",
-            signal_payload="",
-            enable_playwright=False,
-            enable_tailscale=False,
-            enable_signal_cli=False,
-        ),
+        replace(_DEFAULT_UP, vm_number=94),
         tart,
     )
 
     assert calls == ["delete:94", "up:94:standard"]
 
 
-def test_up_missing_marker_on_existing_vm_requires_recreate(isolated_paths, monkeypatch):
-    tart = FakeTart()
-    vm_name = "clawbox-91"
-    tart.exists[vm_name] = True
-    tart.running[vm_name] = True
-    orchestrator.ensure_secrets_file(create_if_missing=True)
-    monkeypatch.setattr(orchestrator, "_acquire_locks", lambda *args, **kwargs: None)
-
-    with pytest.raises(UserFacingError, match="Provision marker is missing for existing VM"):
-        orchestrator.up(
-            UpOptions(
-                vm_number=91,
-                profile="standard",
-                openclaw_source="",
-                openclaw_payload="",
-                signal_payload="",
-                enable_playwright=False,
-                enable_tailscale=False,
-                enable_signal_cli=False,
-            ),
-            tart,
-        )
-
-
-def test_up_marker_mismatch_requires_recreate(isolated_paths, monkeypatch):
-    tart = FakeTart()
-    vm_name = "clawbox-91"
-    tart.exists[vm_name] = True
-    tart.running[vm_name] = True
-    orchestrator.ensure_secrets_file(create_if_missing=True)
-    orchestrator.ProvisionMarker(
-        vm_name=vm_name,
-        profile="standard",
-        playwright=False,
-        tailscale=False,
-        signal_cli=False,
-        signal_payload=False,
-        provisioned_at="2026-01-01T00:00:00Z",
-    ).write(orchestrator.STATE_DIR / f"{vm_name}.provisioned")
-
-    monkeypatch.setattr(orchestrator, "_acquire_locks", lambda *args, **kwargs: None)
+@pytest.mark.parametrize(
+    ("write_marker", "developer", "message"),
+    [
+        (False, False, "Provision marker is missing for existing VM"),
+        (True, True, "Requested options do not match"),
+    ],
+    ids=["missing_marker", "mismatch"],
+)
+def test_up_existing_vm_requires_recreate(
+    isolated_paths, tart, running_vm, write_marker, developer, message, no_locks
+):
+    _existing_standard_vm(running_vm, write_marker=write_marker)
+    overrides = {}
+    if developer:
+        overrides = {
+            "profile": "developer",
+            "openclaw_source": str(isolated_paths),
+            "openclaw_payload": str(isolated_paths),
+            "enable_playwright": True,
+        }
 
-    with pytest.raises(UserFacingError, match="Requested options do not match"):
-        orchestrator.up(
-            UpOptions(
-                vm_number=91,
-                profile="developer",
-                openclaw_source=str(isolated_paths),
-                openclaw_payload=str(isolated_paths),
-                signal_payload="",
-                enable_playwright=True,
-                enable_tailscale=False,
-                enable_signal_cli=False,
-            ),
-            tart,
-        )
+    with pytest.raises(UserFacingError, match=message):
+        orchestrator.up(replace(_DEFAULT_UP, **overrides), tart)
 
 
-def test_up_developer_marker_missing_sync_backend_requires_recreate(isolated_paths, monkeypatch):
-    tart = FakeTart()
-    vm_name = "clawbox-91"
-    tart.exists[vm_name] = True
-    tart.running[vm_name] = True
+def test_up_developer_marker_missing_sync_backend_requires_recreate(isolated_paths, tart, running_vm, no_locks):
+    vm_name = running_vm
     orchestrator.ensure_secrets_file(create_if_missing=True)
     orchestrator.ProvisionMarker(
         vm_name=vm_name,
@@ -639,79 +564,42 @@ def test_up_developer_marker_missing_sync_backend_requires_recreate(isolated_pat
         provisioned_at="2026-01-01T00:00:00Z",
         sync_backend="",
     ).write(orchestrator.STATE_DIR / f"{vm_name}.provisioned")
-    monkeypatch.setattr(orchestrator, "_acquire_locks", lambda *args, **kwargs: None)
 
     with pytest.raises(UserFacingError, match="legacy provision marker format"):
         orchestrator.up(
-            UpOptions(
-                vm_number=91,
+            replace(
+                _DEFAULT_UP,
                 profile="developer",
                 openclaw_source=str(isolated_paths),
                 openclaw_payload=str(isolated_paths),
-                signal_payload="",
-                enable_playwright=False,
-                enable_tailscale=False,
-                enable_signal_cli=False,
             ),
             tart,
         )
 
 
-def test_provision_standard_accepts_optional_flags(isolated_paths, monkeypatch):
-    tart = FakeTart()
-    tart.exists["clawbox-91"] = True
-    tart.running["clawbox-91"] = True
+def test_provision_standard_accepts_optional_flags(monkeypatch, tart, running_vm, fake_run):
     orchestrator.ensure_secrets_file(create_if_missing=True)
     monkeypatch.setattr(orchestrator, "_resolve_vm_ip", lambda *args, **kwargs: "192.168.64.10")
-    seen_playbook_cmd: list[str] = []
-
-    def fake_run(args, **kwargs):
-        if args and args[0] == "ansible-playbook":
-            seen_playbook_cmd[:] = list(args)
-        return subprocess.CompletedProcess(args=args, returncode=0, stdout="", stderr="")
-
-    monkeypatch.setattr(orchestrator.subprocess, "run", fake_run)
     orchestrator.provision_vm(
-        ProvisionOptions(
-            vm_number=91,
-            profile="standard",
-            enable_playwright=True,
-            enable_tailscale=True,
-            enable_signal_cli=True,
-            enable_signal_payload=False,
-        ),
+        replace(_DEFAULT_PROVISION, enable_playwright=True, enable_tailscale=True, enable_signal_cli=True),
         tart,
     )
-    assert "clawbox_enable_playwright=true" in seen_playbook_cmd
-    assert "clawbox_enable_tailscale=true" in seen_playbook_cmd
-    assert "clawbox_enable_signal_cli=true" in seen_playbook_cmd
+    playbook_cmd = fake_run.calls_to("ansible-playbook")[-1]
+    assert "clawbox_enable_playwright=true" in playbook_cmd
+    assert "clawbox_enable_tailscale=true" in playbook_cmd
+    assert "clawbox_enable_signal_cli=true" in playbook_cmd
 
 
-def test_provision_developer_writes_sync_backend_mutagen(isolated_paths, monkeypatch):
-    tart = FakeTart()
-    vm_name = "clawbox-91"
-    tart.exists[vm_name] = True
-    tart.running[vm_name] = True
+def test_provision_developer_writes_sync_backend_mutagen(monkeypatch, tart, running_vm, fake_run):
+    vm_name = running_vm
     marker_file = orchestrator.STATE_DIR / f"{vm_name}.provisioned"
     marker_file.unlink(missing_ok=True)
     orchestrator.ensure_secrets_file(create_if_missing=True)
     monkeypatch.setattr(orchestrator, "_resolve_vm_ip", lambda *args, **kwargs: "192.168.64.10")
     monkeypatch.setattr(orchestrator, "_activate_mutagen_sync_from_locks", lambda *_args, **_kwargs: None)
-    monkeypatch.setattr(
-        orchestrator.subprocess,
-        "run",
-        lambda args, **kwargs: subprocess.CompletedProcess(args=args, returncode=0, stdout="", stderr=""),
-    )
 
     orchestrator.provision_vm(
-        ProvisionOptions(
-            vm_number=91,
-            profile="developer",
-            enable_playwright=False,
-            enable_tailscale=False,
-            enable_signal_cli=False,
-            enable_signal_payload=False,
-        ),
+        replace(_DEFAULT_PROVISION, profile="developer"),
         tart,
     )
     marker = orchestrator.ProvisionMarker.from_file(marker_file)
@@ -719,11 +607,8 @@ def test_provision_developer_writes_sync_backend_mutagen(isolated_paths, monkeyp
     assert marker.sync_backend == "mutagen"
 
 
-def test_provision_developer_activates_sync_from_locks_by_default(isolated_paths, monkeypatch):
-    tart = FakeTart()
-    vm_name = "clawbox-91"
-    tart.exists[vm_name] = True
-    tart.running[vm_name] = True
+def test_provision_developer_activates_sync_from_locks_by_default(monkeypatch, tart, running_vm, fake_run):
+    vm_name = running_vm
     orchestrator.ensure_secrets_file(create_if_missing=True)
     monkeypatch.setattr(orchestrator, "_resolve_vm_ip", lambda *args, **kwargs: "192.168.64.10")
 
@@ -733,32 +618,17 @@ def test_provision_developer_activates_sync_from_locks_by_default(isolated_paths
         "_activate_mutagen_sync_from_locks",
         lambda _vm_name, _tart, **_kwargs: activations.append(_vm_name),
     )
-    monkeypatch.setattr(
-        orchestrator.subprocess,
-        "run",
-        lambda args, **kwargs: subprocess.CompletedProcess(args=args, returncode=0, stdout="", stderr=""),
-    )
 
     orchestrator.provision_vm(
-        ProvisionOptions(
-            vm_number=91,
-            profile="developer",
-            enable_playwright=False,
-            enable_tailscale=False,
-            enable_signal_cli=False,
-            enable_signal_payload=False,
-        ),
+        replace(_DEFAULT_PROVISION, profile="developer"),
         tart,
     )
 
     assert activations == [vm_name]
 
 
-def test_provision_developer_can_skip_sync_reactivation(isolated_paths, monkeypatch):
-    tart = FakeTart()
-    vm_name = "clawbox-91"
-    tart.exists[vm_name] = True
-    tart.running[vm_name] = True
+def test_provision_developer_can_skip_sync_reactivation(monkeypatch, tart, running_vm, fake_run):
+    vm_name = running_vm
     orchestrator.ensure_secrets_file(create_if_missing=True)
     monkeypatch.setattr(orchestrator, "_resolve_vm_ip", lambda *args, **kwargs: "192.168.64.10")
     monkeypatch.setattr(
@@ -768,96 +638,51 @@ def test_provision_developer_can_skip_sync_reactivation(isolated_paths, monkeypa
             AssertionError("should skip mutagen reactivation")
         ),
     )
-    monkeypatch.setattr(
-        orchestrator.subprocess,
-        "run",
-        lambda args, **kwargs: subprocess.CompletedProcess(args=args, returncode=0, stdout="", stderr=""),
-    )
 
     orchestrator.provision_vm(
-        ProvisionOptions(
-            vm_number=91,
-            profile="developer",
-            enable_playwright=False,
-            enable_tailscale=False,
-            enable_signal_cli=False,
-            enable_signal_payload=False,
-            skip_sync_activation=True,
-        ),
+        replace(_DEFAULT_PROVISION, profile="developer", skip_sync_activation=True),
         tart,
     )
 
 
-def test_up_signal_payload_requires_explicit_signal_cli_flag(isolated_paths):
-    tart = FakeTart()
+def test_up_signal_payload_requires_explicit_signal_cli_flag(isolated_paths, tart):
     with pytest.raises(UserFacingError, match="--signal-cli-payload requires --add-signal-cli-provisioning"):
         orchestrator.up(
-            UpOptions(
-                vm_number=91,
+            replace(
+                _DEFAULT_UP,
                 profile="developer",
                 openclaw_source=str(isolated_paths),
                 openclaw_payload=str(isolated_paths),
                 signal_payload=str(isolated_paths),
-                enable_playwright=False,
-                enable_tailscale=False,
-                enable_signal_cli=False,
             ),
             tart,
         )
 
 
-def test_provision_signal_payload_requires_explicit_signal_cli_flag(isolated_paths):
-    tart = FakeTart()
+def test_provision_signal_payload_requires_explicit_signal_cli_flag(tart):
     with pytest.raises(
         UserFacingError, match="--enable-signal-payload requires --add-signal-cli-provisioning"
     ):
         orchestrator.provision_vm(
-            ProvisionOptions(
-                vm_number=91,
-                profile="developer",
-                enable_playwright=False,
-                enable_tailscale=False,
-                enable_signal_cli=False,
-                enable_signal_payload=True,
-            ),
+            replace(_DEFAULT_PROVISION, profile="developer", enable_signal_payload=True),
             tart,
         )
 
 
-def test_provision_vm_surfaces_playbook_failure(isolated_paths, monkeypatch):
-    tart = FakeTart()
-    tart.exists["clawbox-91"] = True
-    tart.running["clawbox-91"] = True
+def test_provision_vm_surfaces_playbook_failure(monkeypatch, tart, running_vm, fake_run):
     orchestrator.ensure_secrets_file(create_if_missing=True)
     monkeypatch.setattr(orchestrator, "_resolve_vm_ip", lambda *args, **kwargs: "192.168.64.10")
-    seen_playbook_cmd: list[str] = []
-
-    def fake_run(args, **kwargs):
-        if args and args[0] == "ansible-playbook":
-            seen_playbook_cmd[:] = list(args)
-            return subprocess.CompletedProcess(args=args, returncode=1, stdout="", stderr="")
-        return subprocess.CompletedProcess(args=args, returncode=0, stdout="", stderr="")
-
-    monkeypatch.setattr(orchestrator.subprocess, "run", fake_run)
+    fake_run.returncodes["ansible-playbook"] = 1
     with pytest.raises(UserFacingError, match="Provisioning failed"):
-        orchestrator.provision_vm(
-            ProvisionOptions(
-                vm_number=91,
-                profile="standard",
-                enable_playwright=False,
-                enable_tailscale=False,
-                enable_signal_cli=False,
-                enable_signal_payload=False,
-            ),
-            tart,
-        )
-    assert "-i" in seen_playbook_cmd
-    inventory_index = seen_playbook_cmd.index("-i")
-    assert seen_playbook_cmd[inventory_index + 1] == "192.168.64.10,"
-    assert "ansible_become=true" in seen_playbook_cmd
+        orchestrator.provision_vm(_DEFAULT_PROVISION, tart)
+    playbook_cmd = fake_run.calls_to("ansible-playbook")[-1]
+    assert "-i" in playbook_cmd
+    inventory_index = playbook_cmd.index("-i")
+    assert playbook_cmd[inventory_index + 1] == "192.168.64.10,"
+    assert "ansible_become=true" in playbook_cmd
 
 
-def test_preflight_signal_payload_marker_times_out(isolated_paths, monkeypatch):
+def test_preflight_signal_payload_marker_times_out(monkeypatch, no_sleep):
     marker_path = (
         f"{orchestrator.SIGNAL_PAYLOAD_MOUNT}/{orchestrator.SIGNAL_PAYLOAD_MARKER_FILENAME}"
     )
@@ -871,7 +696,6 @@ def test_preflight_signal_payload_marker_times_out(isolated_paths, monkeypatch):
             stderr="",
         ),
     )
-    monkeypatch.setattr(orchestrator.time, "sleep", lambda *args, **kwargs: None)
 
     with pytest.raises(UserFacingError, match="signal-cli payload marker was not visible"):
         orchestrator._preflight_signal_payload_marker(
@@ -881,13 +705,9 @@ def test_preflight_signal_payload_marker_times_out(isolated_paths, monkeypatch):
         )
 
 
-def test_provision_vm_developer_signal_payload_runs_marker_preflight(isolated_paths, monkeypatch):
-    tart = FakeTart()
-    tart.exists["clawbox-91"] = True
-    tart.running["clawbox-91"] = True
+def test_provision_vm_developer_signal_payload_runs_marker_preflight(monkeypatch, tart, running_vm, fake_run):
     orchestrator.ensure_secrets_file(create_if_missing=True)
     called: list[dict[str, object]] = []
-    playbook_calls: list[list[str]] = []
 
     monkeypatch.setattr(orchestrator, "_resolve_vm_ip", lambda *args, **kwargs: "192.168.64.10")
     monkeypatch.setattr(
@@ -896,22 +716,8 @@ def test_provision_vm_developer_signal_payload_runs_marker_preflight(isolated_pa
         lambda vm_name, **kwargs: called.append({"vm_name": vm_name, **kwargs}),
     )
 
-    def fake_run(args, **kwargs):
-        if args and args[0] == "ansible-playbook":
-            playbook_calls.append(list(args))
-        return subprocess.CompletedProcess(args=args, returncode=0, stdout="", stderr="")
-
-    monkeypatch.setattr(orchestrator.subprocess, "run", fake_run)
-
     orchestrator.provision_vm(
-        ProvisionOptions(
-            vm_number=91,
-            profile="developer",
-            enable_playwright=False,
-            enable_tailscale=False,
-            enable_signal_cli=True,
-            enable_signal_payload=True,
-        ),
+        replace(_DEFAULT_PROVISION, profile="developer", enable_signal_cli=True, enable_signal_payload=True),
         tart,
     )
 
@@ -924,6 +730,7 @@ def test_provision_vm_developer_signal_payload_runs_marker_preflight(isolated_pa
             "target_host": "192.168.64.10",
         }
     ]
+    playbook_calls = fake_run.calls_to("ansible-playbook")
     assert playbook_calls
     playbook_cmd = playbook_calls[0]
     assert "-i" in playbook_cmd
@@ -932,46 +739,23 @@ def test_provision_vm_developer_signal_payload_runs_marker_preflight(isolated_pa
     assert "vm_number=91" in playbook_cmd
 
 
-def test_provision_vm_fails_when_vm_missing(isolated_paths):
-    tart = FakeTart()
+def test_provision_vm_fails_when_vm_missing(tart):
     orchestrator.ensure_secrets_file(create_if_missing=True)
 
     with pytest.raises(UserFacingError, match="does not exist"):
-        orchestrator.provision_vm(
-            ProvisionOptions(
-                vm_number=91,
-                profile="standard",
-                enable_playwright=False,
-                enable_tailscale=False,
-                enable_signal_cli=False,
-                enable_signal_payload=False,
-            ),
-            tart,
-        )
+        orchestrator.provision_vm(_DEFAULT_PROVISION, tart)
 
 
-def test_provision_vm_fails_when_vm_not_running(isolated_paths):
-    tart = FakeTart()
+def test_provision_vm_fails_when_vm_not_running(tart):
     tart.exists["clawbox-91"] = True
     tart.running["clawbox-91"] = False
     orchestrator.ensure_secrets_file(create_if_missing=True)
 
     with pytest.raises(UserFacingError, match="is not running"):
-        orchestrator.provision_vm(
-            ProvisionOptions(
-                vm_number=91,
-                profile="standard",
-                enable_playwright=False,
-                enable_tailscale=False,
-                enable_signal_cli=False,
-                enable_signal_payload=False,
-            ),
-            tart,
-        )
+        orchestrator.provision_vm(_DEFAULT_PROVISION, tart)
 
 
-def test_up_developer_runs_mount_preflight(isolated_paths, monkeypatch):
-    tart = FakeTart()
+def test_up_developer_runs_mount_preflight(isolated_paths, monkeypatch, tart, no_locks):
     called: list[dict[str, object]] = []
 
     def fake_create(vm_number, _tart):
@@ -1000,7 +784,6 @@ def test_up_developer_runs_mount_preflight(isolated_paths, monkeypatch):
         )
         marker.write(orchestrator.STATE_DIR / "clawbox-91.provisioned")
 
-    monkeypatch.setattr(orchestrator, "_acquire_locks", lambda *args, **kwargs: None)
     monkeypatch.setattr(orchestrator, "create_vm", fake_create)
     monkeypatch.setattr(orchestrator, "launch_vm", fake_launch)
     monkeypatch.setattr(orchestrator, "provision_vm", fake_provision)
@@ -1012,15 +795,11 @@ def test_up_developer_runs_mount_preflight(isolated_paths, monkeypatch):
     )
 
     orchestrator.up(
-        UpOptions(
-            vm_number=91,
+        replace(
+            _DEFAULT_UP,
             profile="developer",
             openclaw_source=str(isolated_paths),
             openclaw_payload=str(isolated_paths),
-            signal_payload="",
-            enable_playwright=False,
-            enable_tailscale=False,
-            enable_signal_cli=False,
         ),
         tart,
     )
@@ -1062,119 +841,91 @@ def test_preflight_developer_mounts_cleans_probe_files_on_error(tmp_path: Path,
     assert list(signal_dir.iterdir()) == []
 
 
-def test_resolve_vm_ip_times_out(monkeypatch):
-    tart = FakeTart()
+def test_resolve_vm_ip_times_out(tart, no_sleep):
     tart.ip = lambda vm_name: None  # type: ignore[method-assign]
-    monkeypatch.setattr(orchestrator.time, "sleep", lambda *args, **kwargs: None)
     with pytest.raises(UserFacingError, match="Timed out waiting for 'clawbox-91' to report an IP address"):
         orchestrator._resolve_vm_ip(tart, "clawbox-91", timeout_seconds=1)
 
 
-def test_openclaw_source_lock_conflict_and_reclaim(tmp_path: Path):
-    tart = FakeTart()
+def test_openclaw_source_lock_conflict_and_reclaim(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, tart: FakeTart):
     path = tmp_path / "shared-source"
     vm1 = "clawbox-91"
     vm2 = "clawbox-92"
     tart.running[vm1] = True
 
-    old_home = os.environ.get("HOME")
-    try:
-        os.environ["HOME"] = str(tmp_path / "home")
-        Path(os.environ["HOME"]).mkdir(parents=True, exist_ok=True)
-
-        acquire_path_lock(OPENCLAW_SOURCE_LOCK, vm1, str(path), tart)
-        with pytest.raises(LockError, match="already in use by running VM 'clawbox-91'"):
-            acquire_path_lock(OPENCLAW_SOURCE_LOCK, vm2, str(path), tart)
+    home = tmp_path / "home"
+    home.mkdir(parents=True, exist_ok=True)
+    monkeypatch.setenv("HOME", str(home))
 
-        tart.running[vm1] = False
+    acquire_path_lock(OPENCLAW_SOURCE_LOCK, vm1, str(path), tart)
+    with pytest.raises(LockError, match="already in use by running VM 'clawbox-91'"):
         acquire_path_lock(OPENCLAW_SOURCE_LOCK, vm2, str(path), tart)
 
-        lock_root = Path(os.environ["HOME"]) / ".clawbox" / "locks" / OPENCLAW_SOURCE_LOCK.lock_kind
-        owner_vm_files = list(lock_root.rglob("owner_vm"))
-        assert owner_vm_files
-        assert "clawbox-92" in owner_vm_files[0].read_text(encoding="utf-8")
-    finally:
-        if old_home is None:
-            os.environ.pop("HOME", None)
-        else:
-            os.environ["HOME"] = old_home
+    tart.running[vm1] = False
+    acquire_path_lock(OPENCLAW_SOURCE_LOCK, vm2, str(path), tart)
+
+    lock_root = home / ".clawbox" / "locks" / OPENCLAW_SOURCE_LOCK.lock_kind
+    owner_vm_files = list(lock_root.rglob("owner_vm"))
+    assert owner_vm_files
+    assert "clawbox-92" in owner_vm_files[0].read_text(encoding="utf-8")
 
 
-def test_openclaw_source_lock_reclaims_corrupt_metadata(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
-    tart = FakeTart()
+def test_openclaw_source_lock_reclaims_corrupt_metadata(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, tart: FakeTart):
     path = tmp_path / "shared-source"
     vm_name = "clawbox-91"
     home = tmp_path / "home"
-    old_home = os.environ.get("HOME")
-    try:
-        os.environ["HOME"] = str(home)
-        home.mkdir(parents=True, exist_ok=True)
-        monkeypatch.setattr(lock_ops.time, "sleep", lambda *_args, **_kwargs: None)
+    home.mkdir(parents=True, exist_ok=True)
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.setattr(lock_ops.time, "sleep", lambda *_args, **_kwargs: None)
 
-        canonical = path.expanduser().resolve()
-        key = hashlib.sha256(str(canonical).encode("utf-8")).hexdigest()
-        lock_dir = home / ".clawbox" / "locks" / OPENCLAW_SOURCE_LOCK.lock_kind / key
-        lock_dir.mkdir(parents=True, exist_ok=True)
+    canonical = path.expanduser().resolve()
+    key = hashlib.sha256(str(canonical).encode("utf-8")).hexdigest()
+    lock_dir = home / ".clawbox" / "locks" / OPENCLAW_SOURCE_LOCK.lock_kind / key
+    lock_dir.mkdir(parents=True, exist_ok=True)
 
-        acquire_path_lock(OPENCLAW_SOURCE_LOCK, vm_name, str(path), tart)
+    acquire_path_lock(OPENCLAW_SOURCE_LOCK, vm_name, str(path), tart)
 
-        owner_vm = (lock_dir / "owner_vm").read_text(encoding="utf-8").strip()
-        assert owner_vm == vm_name
-    finally:
-        if old_home is None:
-            os.environ.pop("HOME", None)
-        else:
-            os.environ["HOME"] = old_home
+    owner_vm = (lock_dir / "owner_vm").read_text(encoding="utf-8").strip()
+    assert owner_vm == vm_name
 
 
 def test_openclaw_source_lock_prunes_previous_lock_for_same_vm(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, tart: FakeTart
 ):
-    tart = FakeTart()
     path_one = tmp_path / "shared-source-1"
     path_two = tmp_path / "shared-source-2"
     vm_name = "clawbox-91"
     home = tmp_path / "home"
-    old_home = os.environ.get("HOME")
-    try:
-        os.environ["HOME"] = str(home)
-        home.mkdir(parents=True, exist_ok=True)
-        monkeypatch.setattr(lock_ops.time, "sleep", lambda *_args, **_kwargs: None)
-
-        acquire_path_lock(OPENCLAW_SOURCE_LOCK, vm_name, str(path_one), tart)
-        acquire_path_lock(OPENCLAW_SOURCE_LOCK, vm_name, str(path_two), tart)
-
-        lock_root = home / ".clawbox" / "locks" / OPENCLAW_SOURCE_LOCK.lock_kind
-        lock_dirs = [d for d in lock_root.iterdir() if d.is_dir()]
-        assert len(lock_dirs) == 1
-        assert (lock_dirs[0] / "owner_vm").read_text(encoding="utf-8").strip() == vm_name
-        assert (lock_dirs[0] / "source_path").read_text(encoding="utf-8").strip() == str(
-            path_two.resolve()
-        )
-    finally:
-        if old_home is None:
-            os.environ.pop("HOME", None)
-        else:
-            os.environ["HOME"] = old_home
+    home.mkdir(parents=True, exist_ok=True)
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.setattr(lock_ops.time, "sleep", lambda *_args, **_kwargs: None)
+
+    acquire_path_lock(OPENCLAW_SOURCE_LOCK, vm_name, str(path_one), tart)
+    acquire_path_lock(OPENCLAW_SOURCE_LOCK, vm_name, str(path_two), tart)
+
+    lock_root = home / ".clawbox" / "locks" / OPENCLAW_SOURCE_LOCK.lock_kind
+    lock_dirs = [d for d in lock_root.iterdir() if d.is_dir()]
+    assert len(lock_dirs) == 1
+    assert (lock_dirs[0] / "owner_vm").read_text(encoding="utf-8").strip() == vm_name
+    assert (lock_dirs[0] / "source_path").read_text(encoding="utf-8").strip() == str(
+        path_two.resolve()
+    )
 
 
-def test_down_vm_stops_running_and_cleans_locks(isolated_paths, monkeypatch):
-    tart = FakeTart()
-    vm_name = "clawbox-91"
-    tart.exists[vm_name] = True
-    tart.running[vm_name] = True
+def test_down_vm_stops_running_and_cleans_locks(monkeypatch, tart, running_vm, capsys):
+    vm_name = running_vm
     cleaned: list[str] = []
     monkeypatch.setattr(orchestrator, "cleanup_locks_for_vm", lambda name: cleaned.append(name))
 
-    out = capture_stdout(lambda: orchestrator.down_vm(91, tart))
+    orchestrator.down_vm(91, tart)
+    out = capsys.readouterr().out
 
     assert vm_name in tart.stop_calls
     assert cleaned == [vm_name]
     assert "VM 'clawbox-91' stopped." in out
 
 
-def test_delete_vm_removes_vm_marker_and_locks(isolated_paths, monkeypatch):
-    tart = FakeTart()
+def test_delete_vm_removes_vm_marker_and_locks(monkeypatch, tart, capsys):
     vm_name = "clawbox-91"
     marker_file = orchestrator.STATE_DIR / f"{vm_name}.provisioned"
     marker_file.parent.mkdir(parents=True, exist_ok=True)
@@ -1184,7 +935,8 @@ def test_delete_vm_removes_vm_marker_and_locks(isolated_paths, monkeypatch):
     cleaned: list[str] = []
     monkeypatch.setattr(orchestrator, "cleanup_locks_for_vm", lambda name: cleaned.append(name))
 
-    out = capture_stdout(lambda: orchestrator.delete_vm(91, tart))
+    orchestrator.delete_vm(91, tart)
+    out = capsys.readouterr().out
 
     assert vm_name in tart.stop_calls
     assert vm_name in tart.delete_calls
@@ -1193,18 +945,15 @@ def test_delete_vm_removes_vm_marker_and_locks(isolated_paths, monkeypatch):
     assert "Deleted VM: clawbox-91" in out
 
 
-def test_ip_vm_prints_resolved_ip(isolated_paths):
-    tart = FakeTart()
-    vm_name = "clawbox-91"
-    tart.exists[vm_name] = True
-    tart.running[vm_name] = True
+def test_ip_vm_prints_resolved_ip(tart, running_vm, capsys):
+    vm_name = running_vm
 
-    out = capture_stdout(lambda: orchestrator.ip_vm(91, tart))
+    orchestrator.ip_vm(91, tart)
+    out = capsys.readouterr().out
     assert out.strip() == "192.168.64.10"
 
 
-def test_ip_vm_fails_when_vm_not_running(isolated_paths):
-    tart = FakeTart()
+def test_ip_vm_fails_when_vm_not_running(tart):
     vm_name = "clawbox-91"
     tart.exists[vm_name] = True
     tart.running[vm_name] = False
@@ -1231,11 +980,25 @@ def test_parse_mount_statuses_handles_wrapped_output():
     assert parsed["/Users/Shared/clawbox-sync/openclaw-payload"] == "dir"
 
 
-def test_status_vm_reports_mounts_without_signal_daemon_probe(isolated_paths, monkeypatch):
-    tart = FakeTart()
-    vm_name = "clawbox-91"
-    tart.exists[vm_name] = True
-    tart.running[vm_name] = True
+def _stub_status_probes(monkeypatch: pytest.MonkeyPatch, *, signal_payload_state: str) -> None:
+    mount_stdout = "\n".join(
+        [
+            f"{orchestrator.OPENCLAW_SOURCE_MOUNT}=mounted",
+            f"{orchestrator.OPENCLAW_PAYLOAD_MOUNT}=mounted",
+            f"{orchestrator.SIGNAL_PAYLOAD_MOUNT}={signal_payload_state}",
+        ]
+    )
+    responses = iter([subprocess.CompletedProcess(args=["ansible"], returncode=0, stdout=mount_stdout, stderr="")])
+    monkeypatch.setattr(status_ops, "_ansible_shell", lambda *args, **kwargs: next(responses))
+    monkeypatch.setattr(
+        status_ops,
+        "_probe_mutagen_sync",
+        lambda _vm_name: ("ok", True, ["Name: clawbox-clawbox-91-openclaw-source", "Status: Watching for changes"]),
+    )
+
+
+def test_status_vm_reports_mounts_without_signal_daemon_probe(monkeypatch, tart, running_vm, capsys):
+    vm_name = running_vm
     marker = orchestrator.ProvisionMarker(
         vm_name=vm_name,
         profile="developer",
@@ -1248,36 +1011,17 @@ def test_status_vm_reports_mounts_without_signal_daemon_probe(isolated_paths, mo
     marker.write(orchestrator.STATE_DIR / f"{vm_name}.provisioned")
     orchestrator.ensure_secrets_file(create_if_missing=True)
 
-    mount_stdout = "\n".join(
-        [
-            f"{orchestrator.OPENCLAW_SOURCE_MOUNT}=mounted",
-            f"{orchestrator.OPENCLAW_PAYLOAD_MOUNT}=mounted",
-            f"{orchestrator.SIGNAL_PAYLOAD_MOUNT}=dir",
-        ]
-    )
-    responses = [subprocess.CompletedProcess(args=["ansible"], returncode=0, stdout=mount_stdout, stderr="")]
-
-    def fake_ansible_shell(*args, **kwargs):
-        return responses.pop(0)
-
-    monkeypatch.setattr(status_ops, "_ansible_shell", fake_ansible_shell)
-    monkeypatch.setattr(
-        status_ops,
-        "_probe_mutagen_sync",
-        lambda _vm_name: ("ok", True, ["Name: clawbox-clawbox-91-openclaw-source", "Status: Watching for changes"]),
-    )
+    _stub_status_probes(monkeypatch, signal_payload_state="dir")
 
-    out = capture_stdout(lambda: orchestrator.status_vm(91, tart))
+    orchestrator.status_vm(91, tart)
+    out = capsys.readouterr().out
     assert "sync paths:" in out
     assert f"{orchestrator.SIGNAL_PAYLOAD_MOUNT}: dir" in out
     assert "signal payload sync daemon:" not in out
 
 
-def test_status_vm_json_reports_mounts_without_signal_daemon_probe(isolated_paths, monkeypatch):
-    tart = FakeTart()
-    vm_name = "clawbox-91"
-    tart.exists[vm_name] = True
-    tart.running[vm_name] = True
+def test_status_vm_json_reports_mounts_without_signal_daemon_probe(monkeypatch, tart, running_vm, capsys):
+    vm_name = running_vm
     marker = orchestrator.ProvisionMarker(
         vm_name=vm_name,
         profile="developer",
@@ -1289,27 +1033,12 @@ def test_status_vm_json_reports_mounts_without_signal_daemon_probe(isolated_path
     )
     marker.write(orchestrator.STATE_DIR / f"{vm_name}.provisioned")
     orchestrator.ensure_secrets_file(create_if_missing=True)
+    capsys.readouterr()
 
-    mount_stdout = "\n".join(
-        [
-            f"{orchestrator.OPENCLAW_SOURCE_MOUNT}=mounted",
-            f"{orchestrator.OPENCLAW_PAYLOAD_MOUNT}=mounted",
-            f"{orchestrator.SIGNAL_PAYLOAD_MOUNT}=mounted",
-        ]
-    )
-    responses = [subprocess.CompletedProcess(args=["ansible"], returncode=0, stdout=mount_stdout, stderr="")]
-
-    def fake_ansible_shell(*args, **kwargs):
-        return responses.pop(0)
+    _stub_status_probes(monkeypatch, signal_payload_state="mounted")
 
-    monkeypatch.setattr(status_ops, "_ansible_shell", fake_ansible_shell)
-    monkeypatch.setattr(
-        status_ops,
-        "_probe_mutagen_sync",
-        lambda _vm_name: ("ok", True, ["Name: clawbox-clawbox-91-openclaw-source", "Status: Watching for changes"]),
-    )
-
-    out = capture_stdout(lambda: orchestrator.status_vm(91, tart, as_json=True))
+    orchestrator.status_vm(91, tart, as_json=True)
+    out = capsys.readouterr().out
     parsed = json.loads(out)
     assert parsed["vm"] == vm_name
     assert parsed["exists"] is True
@@ -1323,32 +1052,8 @@ def test_status_vm_json_reports_mounts_without_signal_daemon_probe(isolated_path
     assert parsed["signal_payload_sync"]["lines"] == []
 
 
-def test_status_vm_skips_remote_probe_when_marker_missing(isolated_paths, monkeypatch):
-    tart = FakeTart()
-    vm_name = "clawbox-91"
-    tart.exists[vm_name] = True
-    tart.running[vm_name] = True
-    orchestrator.SECRETS_FILE.write_text("not_vm_password: nope\n", encoding="utf-8")
-
-    probes = {"count": 0}
-    monkeypatch.setattr(
-        status_ops,
-        "_ansible_shell",
-        lambda *args, **kwargs: probes.__setitem__("count", probes["count"] + 1)
-        or subprocess.CompletedProcess(args=["ansible"], returncode=0, stdout="", stderr=""),
-    )
-
-    out = capture_stdout(lambda: orchestrator.status_vm(91, tart))
-    assert probes["count"] == 0
-    assert "note: no marker found; skipping remote sync-path probe" in out
-    assert "warnings:" not in out
-
-
-def test_status_vm_json_skips_remote_probe_when_marker_missing(isolated_paths, monkeypatch):
-    tart = FakeTart()
-    vm_name = "clawbox-91"
-    tart.exists[vm_name] = True
-    tart.running[vm_name] = True
+@pytest.mark.parametrize("as_json", [False, True], ids=["text", "json"])
+def test_status_vm_skips_remote_probe_when_marker_missing(monkeypatch, tart, running_vm, capsys, as_json):
     orchestrator.SECRETS_FILE.write_text("not_vm_password: nope\n", encoding="utf-8")
 
     probes = {"count": 0}
@@ -1359,12 +1064,17 @@ def test_status_vm_json_skips_remote_probe_when_marker_missing(isolated_paths, m
         or subprocess.CompletedProcess(args=["ansible"], returncode=0, stdout="", stderr=""),
     )
 
-    out = capture_stdout(lambda: orchestrator.status_vm(91, tart, as_json=True))
-    parsed = json.loads(out)
+    orchestrator.status_vm(91, tart, as_json=as_json)
+    out = capsys.readouterr().out
     assert probes["count"] == 0
-    assert parsed["sync_paths"]["probe"] == "not_applicable"
-    assert parsed["sync_paths"]["note"] == "no marker found; skipping remote sync-path probe"
-    assert parsed["warnings"] == []
+    if as_json:
+        parsed = json.loads(out)
+        assert parsed["sync_paths"]["probe"] == "not_applicable"
+        assert parsed["sync_paths"]["note"] == "no marker found; skipping remote sync-path probe"
+        assert parsed["warnings"] == []
+    else:
+        assert "note: no marker found; skipping remote sync-path probe" in out
+        assert "warnings:" not in out
 
 
 def test_image_build_runs_init_then_build(isolated_paths, monkeypatch):
@@ -16,6 +16,26 @@ def test_parse_up_defaults(monkeypatch: pytest.MonkeyPatch):
     assert args.profile == "standard"
 
 
+def test_parse_args_reuses_built_parser(monkeypatch: pytest.MonkeyPatch):
+    builds: list[argparse.ArgumentParser] = []
+    original = main_cli.build_parser
+
+    def counting_build_parser() -> argparse.ArgumentParser:
+        builds.append(original())
+        return builds[-1]
+
+    main_cli._cached_parser.cache_clear()
+    monkeypatch.setattr(main_cli, "build_parser", counting_build_parser)
+    try:
+        monkeypatch.setattr(sys, "argv", ["clawbox", "up", "--number", "93"])
+        assert main_cli.parse_args().number_final == 93
+        monkeypatch.setattr(sys, "argv", ["clawbox", "up"])
+        assert main_cli.parse_args().number_final == 1
+    finally:
+        main_cli._cached_parser.cache_clear()
+    assert len(builds) == 1
+
+
 def test_parse_recreate_defaults(monkeypatch: pytest.MonkeyPatch):
     monkeypatch.setattr(sys, "argv", ["clawbox", "recreate"])
     args = main_cli.parse_args()
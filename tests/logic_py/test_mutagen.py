@@ -305,3 +305,28 @@ def test_reconcile_vm_sync_ignores_tart_errors(tmp_path: Path) -> None:
     torn_down: list[str] = []
     mutagen_mod.reconcile_vm_sync(_Tart(), tmp_path)
     assert torn_down == []
+
+
+def test_mutagen_available_caches_lookup_per_search_path(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    binary = tmp_path / "bin" / "mutagen"
+    binary.parent.mkdir()
+    binary.write_text("#!/bin/sh\n", encoding="utf-8")
+    binary.chmod(0o755)
+    lookups: list[str | None] = []
+    original_which = mutagen_mod.shutil.which
+
+    def counting_which(cmd: str, mode: int = 0, path: str | None = None) -> str | None:
+        lookups.append(path)
+        return original_which(cmd, path=path)
+
+    monkeypatch.setattr(mutagen_mod.shutil, "which", counting_which)
+    monkeypatch.setenv("PATH", str(binary.parent))
+    assert mutagen_mod.mutagen_available() is True
+    assert mutagen_mod.mutagen_available() is True
+    assert lookups == [str(binary.parent)]
+
+    monkeypatch.setenv("PATH", str(tmp_path / "empty"))
+    assert mutagen_mod.mutagen_available() is False
+    assert lookups == [str(binary.parent), str(tmp_path / "empty")]
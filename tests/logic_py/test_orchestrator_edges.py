@@ -1,18 +1,45 @@
 from __future__ import annotations
 
-import io
 import subprocess
-from contextlib import redirect_stdout
+from collections import Counter
+from dataclasses import replace
 from pathlib import Path
 
 import pytest
 
-from clawbox import orchestrator
+from clawbox import io_utils, orchestrator
 from clawbox.locks import LockError
 from clawbox.orchestrator import ProvisionOptions, UpOptions, UserFacingError
 from clawbox.tart import TartError
 
 
+_DEFAULT_UP = UpOptions(
+    vm_number=91,
+    profile="standard",
+    openclaw_source="",
+    openclaw_payload="",
+    signal_payload="",
+    enable_playwright=False,
+    enable_tailscale=False,
+    enable_signal_cli=False,
+)
+_DEFAULT_PROVISION = ProvisionOptions(
+    vm_number=91,
+    profile="standard",
+    enable_playwright=False,
+    enable_tailscale=False,
+    enable_signal_cli=False,
+    enable_signal_payload=False,
+)
+
+
+def _raiser(exc: BaseException):
+    def _raise(*_args, **_kwargs):
+        raise exc
+
+    return _raise
+
+
 class DummyProcess:
     def __init__(self, pid: int = 1000):
         self.pid = pid
@@ -26,10 +53,13 @@ class FakeTart:
         self.exists: dict[str, bool] = {}
         self.running: dict[str, bool] = {}
         self.ip_map: dict[str, str | None] = {}
-        self.stop_calls: list[str] = []
-        self.delete_calls: list[str] = []
+        self.stop_calls: Counter[str] = Counter()
+        self.delete_calls: Counter[str] = Counter()
         self.next_proc = DummyProcess()
 
+    def invalidate(self) -> None:
+        pass
+
     def vm_exists(self, vm_name: str) -> bool:
         return self.exists.get(vm_name, False)
 
@@ -43,11 +73,11 @@ class FakeTart:
         return self.next_proc
 
     def stop(self, vm_name: str) -> None:
-        self.stop_calls.append(vm_name)
+        self.stop_calls[vm_name] += 1
         self.running[vm_name] = False
 
     def delete(self, vm_name: str) -> None:
-        self.delete_calls.append(vm_name)
+        self.delete_calls[vm_name] += 1
 
     def ip(self, vm_name: str) -> str | None:
         return self.ip_map.get(vm_name)
@@ -55,25 +85,20 @@ class FakeTart:
 
 @pytest.fixture
 def isolated_paths(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    # ANSIBLE_DIR, SECRETS_FILE and STATE_DIR are already isolated by conftest.py.
     monkeypatch.setattr(orchestrator, "PROJECT_DIR", tmp_path)
-    monkeypatch.setattr(orchestrator, "ANSIBLE_DIR", tmp_path / "ansible")
-    monkeypatch.setattr(orchestrator, "SECRETS_FILE", tmp_path / "ansible" / "secrets.yml")
-    monkeypatch.setattr(orchestrator, "STATE_DIR", tmp_path / ".clawbox" / "state")
     monkeypatch.setattr(orchestrator, "start_vm_watcher", lambda *_args, **_kwargs: 9999)
     monkeypatch.setattr(orchestrator, "stop_vm_watcher", lambda *_args, **_kwargs: False)
     monkeypatch.setattr(orchestrator, "mutagen_available", lambda: True)
     monkeypatch.setattr(orchestrator, "_activate_mutagen_sync", lambda **_kwargs: None)
     monkeypatch.setattr(orchestrator, "_activate_mutagen_sync_from_locks", lambda *_args, **_kwargs: None)
     monkeypatch.setattr(orchestrator, "_deactivate_mutagen_sync", lambda *_args, **_kwargs: None)
-    (tmp_path / "ansible").mkdir(parents=True, exist_ok=True)
     yield tmp_path
 
 
-def _capture_stdout(fn):
-    buf = io.StringIO()
-    with redirect_stdout(buf):
-        fn()
-    return buf.getvalue()
+@pytest.fixture(autouse=True)
+def _no_sleep(fake_clock: dict[str, float]) -> None:
+    pass
 
 
 def test_env_int_invalid_returns_default(monkeypatch: pytest.MonkeyPatch):
@@ -85,7 +110,7 @@ def test_ensure_secrets_file_maps_missing_error(isolated_paths, monkeypatch: pyt
     monkeypatch.setattr(
         orchestrator,
         "ensure_vm_password_file",
-        lambda *_args, **_kwargs: (_ for _ in ()).throw(FileNotFoundError("missing")),
+        _raiser(FileNotFoundError("missing")),
     )
     with pytest.raises(UserFacingError, match="Secrets file not found"):
         orchestrator.ensure_secrets_file(create_if_missing=False)
@@ -95,7 +120,7 @@ def test_ensure_secrets_file_maps_oserror(isolated_paths, monkeypatch: pytest.Mo
     monkeypatch.setattr(
         orchestrator,
         "ensure_vm_password_file",
-        lambda *_args, **_kwargs: (_ for _ in ()).throw(OSError("denied")),
+        _raiser(OSError("denied")),
     )
     with pytest.raises(UserFacingError, match="Could not write secrets file"):
         orchestrator.ensure_secrets_file(create_if_missing=True)
@@ -107,6 +132,36 @@ def test_tail_lines_reads_last_lines(isolated_paths):
     assert orchestrator.tail_lines(path, 2) == "2\n3"
 
 
+def test_tail_lines_spans_blocks_of_large_files(isolated_paths):
+    path = isolated_paths / "large.log"
+    path.write_text("".join(f"line-{i:05d}\n" for i in range(5000)), encoding="utf-8")
+    assert orchestrator.tail_lines(path, 3) == "line-04997\nline-04998\nline-04999"
+    expected = "\n".join(f"line-{i:05d}" for i in range(4000, 5000))
+    assert orchestrator.tail_lines(path, 1000) == expected
+    assert orchestrator.tail_lines(isolated_paths / "missing.log") == ""
+
+
+def test_tail_lines_returns_empty_when_path_is_a_directory(isolated_paths):
+    (isolated_paths / "logs").mkdir()
+    assert orchestrator.tail_lines(isolated_paths / "logs") == ""
+
+
+def test_tail_lines_keeps_tail_read_before_an_error(isolated_paths, monkeypatch: pytest.MonkeyPatch):
+    path = isolated_paths / "large.log"
+    path.write_text("".join(f"line-{i:05d}\n" for i in range(5000)), encoding="utf-8")
+    original_pread = io_utils.os.pread
+    reads = {"count": 0}
+
+    def flaky_pread(fd: int, size: int, offset: int) -> bytes:
+        reads["count"] += 1
+        if reads["count"] > 1:
+            raise OSError("disk went away")
+        return original_pread(fd, size, offset)
+
+    monkeypatch.setattr(io_utils.os, "pread", flaky_pread)
+    assert orchestrator.tail_lines(path, 1000).endswith("line-04998\nline-04999")
+
+
 def test_validate_profile_rejects_invalid():
     with pytest.raises(UserFacingError, match="--profile must be"):
         orchestrator._validate_profile("bad-profile")
@@ -129,12 +184,25 @@ def test_signal_payload_host_marker_maps_oserror(tmp_path: Path, monkeypatch: py
         orchestrator._ensure_signal_payload_host_marker(str(marker_dir), "clawbox-91")
 
 
+def test_signal_payload_host_marker_skips_rewrite_when_current(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    orchestrator._ensure_signal_payload_host_marker(str(tmp_path), "clawbox-91")
+    marker_path = tmp_path / orchestrator.SIGNAL_PAYLOAD_MARKER_FILENAME
+    assert "vm: clawbox-91" in marker_path.read_text(encoding="utf-8")
+
+    monkeypatch.setattr(Path, "write_text", _raiser(AssertionError("marker should not be rewritten")))
+    orchestrator._ensure_signal_payload_host_marker(str(tmp_path), "clawbox-91")
+    with pytest.raises(AssertionError, match="should not be rewritten"):
+        orchestrator._ensure_signal_payload_host_marker(str(tmp_path), "clawbox-92")
+
+
 def test_acquire_locks_maps_lock_error(monkeypatch: pytest.MonkeyPatch):
     tart = FakeTart()
     monkeypatch.setattr(
         orchestrator,
         "acquire_path_lock",
-        lambda *_args, **_kwargs: (_ for _ in ()).throw(LockError("lock held")),
+        _raiser(LockError("lock held")),
     )
     with pytest.raises(UserFacingError, match="lock held"):
         orchestrator._acquire_locks(tart, "clawbox-91", "/src", "", "")
@@ -147,7 +215,7 @@ def test_launch_vm_maps_tart_launch_error(isolated_paths, monkeypatch: pytest.Mo
     monkeypatch.setattr(
         tart,
         "run_in_background",
-        lambda *_args, **_kwargs: (_ for _ in ()).throw(TartError("run failed")),
+        _raiser(TartError("run failed")),
     )
     with pytest.raises(UserFacingError, match="Failed to launch VM"):
         orchestrator.launch_vm(
@@ -161,7 +229,7 @@ def test_launch_vm_maps_tart_launch_error(isolated_paths, monkeypatch: pytest.Mo
         )
 
 
-def test_launch_vm_running_vm_starts_watcher(isolated_paths, monkeypatch: pytest.MonkeyPatch):
+def test_launch_vm_running_vm_starts_watcher(isolated_paths, monkeypatch: pytest.MonkeyPatch, capsys):
     tart = FakeTart()
     vm_name = "clawbox-91"
     tart.exists[vm_name] = True
@@ -174,17 +242,16 @@ def test_launch_vm_running_vm_starts_watcher(isolated_paths, monkeypatch: pytest
         lambda state_dir, name: watcher.update({"state_dir": state_dir, "vm_name": name}) or 5150,
     )
 
-    out = _capture_stdout(
-        lambda: orchestrator.launch_vm(
-            vm_number=91,
-            profile="standard",
-            openclaw_source="",
-            openclaw_payload="",
-            signal_payload="",
-            headless=False,
-            tart=tart,
-        )
+    orchestrator.launch_vm(
+        vm_number=91,
+        profile="standard",
+        openclaw_source="",
+        openclaw_payload="",
+        signal_payload="",
+        headless=False,
+        tart=tart,
     )
+    out = capsys.readouterr().out
     assert watcher["vm_name"] == vm_name
     assert "Watcher active (PID 5150)." in out
 
@@ -398,7 +465,7 @@ def test_ensure_mutagen_keypair_maps_generation_errors(
     monkeypatch.setattr(
         orchestrator.subprocess,
         "run",
-        lambda *_args, **_kwargs: (_ for _ in ()).throw(FileNotFoundError("missing ssh-keygen")),
+        _raiser(FileNotFoundError("missing ssh-keygen")),
     )
     with pytest.raises(UserFacingError, match="Command not found: ssh-keygen"):
         orchestrator._ensure_mutagen_keypair("clawbox-91")
@@ -530,7 +597,7 @@ def test_activate_mutagen_sync_requires_running_vm(tmp_path: Path, monkeypatch:
         )
 
 
-def test_activate_mutagen_sync_success_flow(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+def test_activate_mutagen_sync_success_flow(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys):
     source = tmp_path / "source"
     payload = tmp_path / "payload"
     source.mkdir(parents=True, exist_ok=True)
@@ -562,16 +629,15 @@ def test_activate_mutagen_sync_success_flow(tmp_path: Path, monkeypatch: pytest.
     marked: list[str] = []
     monkeypatch.setattr(orchestrator, "mark_mutagen_vm_active", lambda _state, vm: marked.append(vm))
 
-    out = _capture_stdout(
-        lambda: orchestrator._activate_mutagen_sync(
-            vm_name="clawbox-91",
-            openclaw_source=str(source),
-            openclaw_payload=str(payload),
-            signal_payload="",
-            tart=tart,
-            auth_mode="vm_user",
-        )
+    orchestrator._activate_mutagen_sync(
+        vm_name="clawbox-91",
+        openclaw_source=str(source),
+        openclaw_payload=str(payload),
+        signal_payload="",
+        tart=tart,
+        auth_mode="vm_user",
     )
+    out = capsys.readouterr().out
     assert "Preparing Mutagen sync..." in out
     assert "optional sync paths still warming up (continuing):" in out
     assert "Mutagen sync active (bidirectional):" in out
@@ -621,7 +687,7 @@ def test_deactivate_mutagen_sync_maps_mutagen_error(monkeypatch: pytest.MonkeyPa
     monkeypatch.setattr(
         orchestrator,
         "teardown_vm_sync",
-        lambda *_args, **_kwargs: (_ for _ in ()).throw(orchestrator.MutagenError("mutagen bad")),
+        _raiser(orchestrator.MutagenError("mutagen bad")),
     )
     with pytest.raises(UserFacingError, match="mutagen bad"):
         orchestrator._deactivate_mutagen_sync("clawbox-91", flush=False)
@@ -716,7 +782,6 @@ def test_wait_for_mutagen_sync_ready_timeout_cleans_markers(
         )
     ]
 
-    monkeypatch.setattr(orchestrator.time, "sleep", lambda *_args, **_kwargs: None)
     monkeypatch.setattr(
         orchestrator,
         "_parse_mount_statuses",
@@ -754,7 +819,6 @@ def test_wait_for_mutagen_sync_ready_timeout_includes_mutagen_diagnostics(
         )
     ]
 
-    monkeypatch.setattr(orchestrator.time, "sleep", lambda *_args, **_kwargs: None)
     monkeypatch.setattr(
         orchestrator,
         "_parse_mount_statuses",
@@ -841,7 +905,7 @@ def test_wait_for_mutagen_sync_ready_allows_optional_missing(
     assert not list(signal_dir.glob(".clawbox-sync-ready-*"))
 
 
-def test_preflight_developer_mounts_success(isolated_paths, monkeypatch: pytest.MonkeyPatch):
+def test_preflight_developer_mounts_success(isolated_paths, monkeypatch: pytest.MonkeyPatch, capsys):
     payload_dir = isolated_paths / "payload"
     payload_dir.mkdir(parents=True, exist_ok=True)
 
@@ -850,16 +914,15 @@ def test_preflight_developer_mounts_success(isolated_paths, monkeypatch: pytest.
         return True, statuses, ""
 
     monkeypatch.setattr(orchestrator, "_wait_for_remote_probe", fake_wait)
-    out = _capture_stdout(
-        lambda: orchestrator._preflight_developer_mounts(
-            "clawbox-91",
-            vm_number=91,
-            openclaw_payload_host=str(payload_dir),
-            signal_payload_host="",
-            include_signal_payload=False,
-            timeout_seconds=3,
-        )
+    orchestrator._preflight_developer_mounts(
+        "clawbox-91",
+        vm_number=91,
+        openclaw_payload_host=str(payload_dir),
+        signal_payload_host="",
+        include_signal_payload=False,
+        timeout_seconds=3,
     )
+    out = capsys.readouterr().out
     assert "synced developer paths verified" in out
 
 
@@ -894,22 +957,21 @@ def test_preflight_developer_mounts_failure_contains_diagnostics(
         )
 
 
-def test_preflight_signal_payload_marker_success(monkeypatch: pytest.MonkeyPatch):
+def test_preflight_signal_payload_marker_success(monkeypatch: pytest.MonkeyPatch, capsys):
     marker_path = f"{orchestrator.SIGNAL_PAYLOAD_MOUNT}/{orchestrator.SIGNAL_PAYLOAD_MARKER_FILENAME}"
     monkeypatch.setattr(
         orchestrator,
         "_wait_for_remote_probe",
         lambda *_args, **_kwargs: (True, {marker_path: "ok"}, ""),
     )
-    out = _capture_stdout(
-        lambda: orchestrator._preflight_signal_payload_marker(
-            "clawbox-91",
-            vm_number=91,
-            timeout_seconds=3,
-            inventory_path="192.168.64.1,",
-            target_host="192.168.64.1",
-        )
+    orchestrator._preflight_signal_payload_marker(
+        "clawbox-91",
+        vm_number=91,
+        timeout_seconds=3,
+        inventory_path="192.168.64.1,",
+        target_host="192.168.64.1",
     )
+    out = capsys.readouterr().out
     assert "signal-cli payload marker verified" in out
 
 
@@ -928,14 +990,7 @@ def test_provision_vm_maps_missing_ansible_playbook(isolated_paths, monkeypatch:
     monkeypatch.setattr(orchestrator.subprocess, "run", raise_not_found)
     with pytest.raises(UserFacingError, match="Command not found: ansible-playbook"):
         orchestrator.provision_vm(
-            ProvisionOptions(
-                vm_number=91,
-                profile="standard",
-                enable_playwright=False,
-                enable_tailscale=False,
-                enable_signal_cli=False,
-                enable_signal_payload=False,
-            ),
+            _DEFAULT_PROVISION,
             tart,
         )
 
@@ -943,13 +998,12 @@ def test_provision_vm_maps_missing_ansible_playbook(isolated_paths, monkeypatch:
 def test_stop_vm_and_wait_timeout(monkeypatch: pytest.MonkeyPatch):
     class NeverStops(FakeTart):
         def stop(self, vm_name: str) -> None:
-            self.stop_calls.append(vm_name)
+            self.stop_calls[vm_name] += 1
             self.running[vm_name] = True
 
     tart = NeverStops()
     tart.running["clawbox-91"] = True
     monkeypatch.setattr(orchestrator, "_deactivate_mutagen_sync", lambda *_args, **_kwargs: None)
-    monkeypatch.setattr(orchestrator.time, "sleep", lambda *_args, **_kwargs: None)
     assert orchestrator._stop_vm_and_wait(tart, "clawbox-91", timeout_seconds=2) is False
 
 
@@ -963,7 +1017,6 @@ def test_stop_vm_and_wait_stops_watcher(monkeypatch: pytest.MonkeyPatch):
         "stop_vm_watcher",
         lambda _state_dir, vm_name: stopped.append(vm_name) or True,
     )
-    monkeypatch.setattr(orchestrator.time, "sleep", lambda *_args, **_kwargs: None)
 
     assert orchestrator._stop_vm_and_wait(tart, "clawbox-91", timeout_seconds=2) is True
     assert stopped == ["clawbox-91"]
@@ -989,17 +1042,7 @@ def test_render_up_command_includes_optional_flags():
 
 
 def test_compute_up_provision_reason_created_vm():
-    opts = UpOptions(
-        vm_number=91,
-        profile="standard",
-        openclaw_source="",
-        openclaw_payload="",
-        signal_payload="",
-        enable_playwright=False,
-        enable_tailscale=False,
-        enable_signal_cli=False,
-    )
-    reason = orchestrator._compute_up_provision_reason(opts, Path("/tmp/nope"), True, False)
+    reason = orchestrator._compute_up_provision_reason(_DEFAULT_UP, Path("/tmp/nope"), True, False)
     assert reason == "VM was created in this run"
 
 
@@ -1007,18 +1050,8 @@ def test_compute_up_provision_reason_parse_failure(isolated_paths):
     marker_file = orchestrator.STATE_DIR / "clawbox-91.provisioned"
     marker_file.parent.mkdir(parents=True, exist_ok=True)
     marker_file.write_text("bad content\n", encoding="utf-8")
-    opts = UpOptions(
-        vm_number=91,
-        profile="standard",
-        openclaw_source="",
-        openclaw_payload="",
-        signal_payload="",
-        enable_playwright=False,
-        enable_tailscale=False,
-        enable_signal_cli=False,
-    )
     with pytest.raises(UserFacingError, match="could not be parsed"):
-        orchestrator._compute_up_provision_reason(opts, marker_file, False, False)
+        orchestrator._compute_up_provision_reason(_DEFAULT_UP, marker_file, False, False)
 
 
 def test_ensure_vm_running_for_up_timeout(monkeypatch: pytest.MonkeyPatch):
@@ -1028,16 +1061,7 @@ def test_ensure_vm_running_for_up_timeout(monkeypatch: pytest.MonkeyPatch):
     with pytest.raises(UserFacingError, match="did not transition to running state"):
         orchestrator._ensure_vm_running_for_up(
             "clawbox-91",
-            UpOptions(
-                vm_number=91,
-                profile="standard",
-                openclaw_source="",
-                openclaw_payload="",
-                signal_payload="",
-                enable_playwright=False,
-                enable_tailscale=False,
-                enable_signal_cli=False,
-            ),
+            _DEFAULT_UP,
             "needs provision",
             tart,
         )
@@ -1050,16 +1074,7 @@ def test_relaunch_gui_after_headless_provision_stop_timeout(monkeypatch: pytest.
     with pytest.raises(UserFacingError, match="Timed out stopping headless VM"):
         orchestrator._relaunch_gui_after_headless_provision(
             "clawbox-91",
-            UpOptions(
-                vm_number=91,
-                profile="standard",
-                openclaw_source="",
-                openclaw_payload="",
-                signal_payload="",
-                enable_playwright=False,
-                enable_tailscale=False,
-                enable_signal_cli=False,
-            ),
+            _DEFAULT_UP,
             tart,
             launched_headless=True,
         )
@@ -1074,16 +1089,7 @@ def test_relaunch_gui_after_headless_provision_relaunch_timeout(monkeypatch: pyt
     with pytest.raises(UserFacingError, match="after GUI relaunch"):
         orchestrator._relaunch_gui_after_headless_provision(
             "clawbox-91",
-            UpOptions(
-                vm_number=91,
-                profile="standard",
-                openclaw_source="",
-                openclaw_payload="",
-                signal_payload="",
-                enable_playwright=False,
-                enable_tailscale=False,
-                enable_signal_cli=False,
-            ),
+            _DEFAULT_UP,
             tart,
             launched_headless=True,
         )
@@ -1101,16 +1107,7 @@ def test_ensure_running_after_provision_launches(monkeypatch: pytest.MonkeyPatch
     monkeypatch.setattr(orchestrator, "launch_vm", lambda *_args, **_kwargs: calls.update(launch=1))
     orchestrator._ensure_running_after_provision_if_needed(
         "clawbox-91",
-        UpOptions(
-            vm_number=91,
-            profile="standard",
-            openclaw_source="",
-            openclaw_payload="",
-            signal_payload="",
-            enable_playwright=False,
-            enable_tailscale=False,
-            enable_signal_cli=False,
-        ),
+        _DEFAULT_UP,
         tart,
         provision_ran=True,
     )
@@ -1123,16 +1120,7 @@ def test_up_errors_when_vm_missing_after_create(isolated_paths, monkeypatch: pyt
     monkeypatch.setattr(orchestrator, "create_vm", lambda *_args, **_kwargs: None)
     with pytest.raises(UserFacingError, match="was not found after create_vm completed"):
         orchestrator.up(
-            UpOptions(
-                vm_number=91,
-                profile="standard",
-                openclaw_source="",
-                openclaw_payload="",
-                signal_payload="",
-                enable_playwright=False,
-                enable_tailscale=False,
-                enable_signal_cli=False,
-            ),
+            _DEFAULT_UP,
             tart,
         )
 
@@ -1146,21 +1134,12 @@ def test_up_errors_when_not_running_after_orchestration(isolated_paths, monkeypa
     monkeypatch.setattr(orchestrator, "_ensure_running_after_provision_if_needed", lambda *_args, **_kwargs: None)
     with pytest.raises(UserFacingError, match="is not running after orchestration"):
         orchestrator.up(
-            UpOptions(
-                vm_number=91,
-                profile="standard",
-                openclaw_source="",
-                openclaw_payload="",
-                signal_payload="",
-                enable_playwright=False,
-                enable_tailscale=False,
-                enable_signal_cli=False,
-            ),
+            _DEFAULT_UP,
             tart,
         )
 
 
-def test_up_mutagen_activates_sync(isolated_paths, monkeypatch: pytest.MonkeyPatch):
+def test_up_mutagen_activates_sync(isolated_paths, monkeypatch: pytest.MonkeyPatch, capsys):
     tart = FakeTart()
     tart.exists["clawbox-91"] = True
     tart.running["clawbox-91"] = True
@@ -1187,21 +1166,16 @@ def test_up_mutagen_activates_sync(isolated_paths, monkeypatch: pytest.MonkeyPat
         lambda **kwargs: activated.append(kwargs["vm_name"]),
     )
 
-    out = _capture_stdout(
-        lambda: orchestrator.up(
-            UpOptions(
-                vm_number=91,
-                profile="developer",
-                openclaw_source=str(isolated_paths),
-                openclaw_payload=str(isolated_paths),
-                signal_payload="",
-                enable_playwright=False,
-                enable_tailscale=False,
-                enable_signal_cli=False,
-            ),
-            tart,
-        )
+    orchestrator.up(
+        replace(
+            _DEFAULT_UP,
+            profile="developer",
+            openclaw_source=str(isolated_paths),
+            openclaw_payload=str(isolated_paths),
+        ),
+        tart,
     )
+    out = capsys.readouterr().out
     assert activated == ["clawbox-91"]
     assert "Clawbox is running: clawbox-91 (provisioning skipped)" in out
 
@@ -1209,15 +1183,35 @@ def test_up_mutagen_activates_sync(isolated_paths, monkeypatch: pytest.MonkeyPat
 def test_wait_for_vm_absent_timeout(monkeypatch: pytest.MonkeyPatch):
     tart = FakeTart()
     tart.exists["clawbox-91"] = True
-    monkeypatch.setattr(orchestrator.time, "sleep", lambda *_args, **_kwargs: None)
     assert orchestrator._wait_for_vm_absent(tart, "clawbox-91", timeout_seconds=2) is False
 
 
-def test_down_vm_nonexistent_cleans_locks(isolated_paths, monkeypatch: pytest.MonkeyPatch):
+def test_wait_for_vm_absent_skips_tart_while_bundle_exists(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    class CountingTart(FakeTart):
+        def __init__(self):
+            super().__init__()
+            self.exists_calls = 0
+
+        def vm_exists(self, vm_name: str) -> bool:
+            self.exists_calls += 1
+            return super().vm_exists(vm_name)
+
+    monkeypatch.setenv("TART_HOME", str(tmp_path / "tart"))
+    (tmp_path / "tart" / "vms" / "clawbox-91").mkdir(parents=True)
+    tart = CountingTart()
+    tart.exists["clawbox-91"] = True
+    assert orchestrator._wait_for_vm_absent(tart, "clawbox-91", timeout_seconds=2) is False
+    assert tart.exists_calls == 0
+
+
+def test_down_vm_nonexistent_cleans_locks(isolated_paths, monkeypatch: pytest.MonkeyPatch, capsys):
     tart = FakeTart()
     cleaned: list[str] = []
     monkeypatch.setattr(orchestrator, "cleanup_locks_for_vm", lambda vm_name: cleaned.append(vm_name))
-    out = _capture_stdout(lambda: orchestrator.down_vm(91, tart))
+    orchestrator.down_vm(91, tart)
+    out = capsys.readouterr().out
     assert "does not exist" in out
     assert cleaned == ["clawbox-91"]
 
@@ -1232,24 +1226,26 @@ def test_down_vm_timeout_raises(monkeypatch: pytest.MonkeyPatch):
         orchestrator.down_vm(91, tart)
 
 
-def test_down_vm_already_stopped_message(monkeypatch: pytest.MonkeyPatch):
+def test_down_vm_already_stopped_message(monkeypatch: pytest.MonkeyPatch, capsys):
     tart = FakeTart()
     tart.exists["clawbox-91"] = True
     tart.running["clawbox-91"] = False
     monkeypatch.setattr(orchestrator, "_deactivate_mutagen_sync", lambda *_args, **_kwargs: None)
     monkeypatch.setattr(orchestrator, "cleanup_locks_for_vm", lambda *_args, **_kwargs: None)
-    out = _capture_stdout(lambda: orchestrator.down_vm(91, tart))
+    orchestrator.down_vm(91, tart)
+    out = capsys.readouterr().out
     assert "already stopped" in out
 
 
-def test_delete_vm_nonexistent_cleans_state(isolated_paths, monkeypatch: pytest.MonkeyPatch):
+def test_delete_vm_nonexistent_cleans_state(isolated_paths, monkeypatch: pytest.MonkeyPatch, capsys):
     marker = orchestrator.STATE_DIR / "clawbox-91.provisioned"
     marker.parent.mkdir(parents=True, exist_ok=True)
     marker.write_text("profile: standard\n", encoding="utf-8")
     tart = FakeTart()
     cleaned: list[str] = []
     monkeypatch.setattr(orchestrator, "cleanup_locks_for_vm", lambda vm_name: cleaned.append(vm_name))
-    out = _capture_stdout(lambda: orchestrator.delete_vm(91, tart))
+    orchestrator.delete_vm(91, tart)
+    out = capsys.readouterr().out
     assert "does not exist" in out
     assert not marker.exists()
     assert cleaned == ["clawbox-91"]
@@ -13,21 +13,24 @@ except ModuleNotFoundError:  # pragma: no cover - Python < 3.11
         tomllib = None
 
 
-PROJECT_DIR = Path(__file__).resolve().parents[2]
-
-
-def test_setuptools_data_files_reference_existing_files() -> None:
+@pytest.fixture(scope="session")
+def pyproject_data(project_dir: Path) -> dict:
     if tomllib is None:
         pytest.skip("tomllib is unavailable on this interpreter")
+    return tomllib.loads((project_dir / "pyproject.toml").read_text(encoding="utf-8"))
+
 
-    pyproject = tomllib.loads((PROJECT_DIR / "pyproject.toml").read_text(encoding="utf-8"))
-    data_files = pyproject.get("tool", {}).get("setuptools", {}).get("data-files", {})
+def test_setuptools_data_files_reference_existing_files(project_dir: Path, pyproject_data: dict) -> None:
+    data_files = pyproject_data.get("tool", {}).get("setuptools", {}).get("data-files", {})
 
-    missing: list[str] = []
-    for destination, files in data_files.items():
-        for file_path in files:
-            if not (PROJECT_DIR / file_path).is_file():
-                missing.append(f"{destination} -> {file_path}")
+    referenced = {
+        (destination, file_path) for destination, files in data_files.items() for file_path in files
+    }
+    missing = [
+        f"{destination} -> {file_path}"
+        for destination, file_path in referenced
+        if not (project_dir / file_path).is_file()
+    ]
 
     assert not missing, (
         "pyproject.toml [tool.setuptools.data-files] contains missing files:\n"
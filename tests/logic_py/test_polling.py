@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import pytest
+
+from clawbox import polling as polling_mod
+from clawbox.polling import poll_until
+
+
+def _record_sleeps(monkeypatch: pytest.MonkeyPatch, clock: dict[str, float]) -> list[float]:
+    sleeps: list[float] = []
+
+    def _sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        clock["now"] += seconds
+
+    monkeypatch.setattr(polling_mod.time, "sleep", _sleep)
+    return sleeps
+
+
+def test_poll_until_backs_off_until_predicate_holds(monkeypatch: pytest.MonkeyPatch, fake_clock):
+    sleeps = _record_sleeps(monkeypatch, fake_clock)
+    results = iter([False, False, False, True])
+
+    assert poll_until(lambda: next(results), 10, initial=0.05, cap=1.0) is True
+    assert sleeps == pytest.approx([0.05, 0.1, 0.2], abs=0.01)
+
+
+def test_poll_until_caps_delay_and_stops_at_deadline(monkeypatch: pytest.MonkeyPatch, fake_clock):
+    sleeps = _record_sleeps(monkeypatch, fake_clock)
+    calls = 0
+
+    def never() -> bool:
+        nonlocal calls
+        calls += 1
+        return False
+
+    assert poll_until(never, 2, initial=0.5, cap=1.0) is False
+    assert sleeps == pytest.approx([0.5, 1.0, 0.5], abs=0.01)
+    assert calls == len(sleeps)
+
+
+def test_poll_until_final_check_runs_once_after_last_sleep(monkeypatch: pytest.MonkeyPatch, fake_clock):
+    sleeps = _record_sleeps(monkeypatch, fake_clock)
+    results = iter([False, False, True])
+
+    assert poll_until(lambda: next(results), 2, initial=1, cap=1, factor=1.0, final_check=True) is True
+    assert sleeps == pytest.approx([1, 1])
+
+
+def test_poll_until_final_check_skips_repeat_when_predicate_ran_at_deadline(
+    monkeypatch: pytest.MonkeyPatch, fake_clock
+):
+    _record_sleeps(monkeypatch, fake_clock)
+    calls = 0
+
+    def slow_false() -> bool:
+        nonlocal calls
+        calls += 1
+        fake_clock["now"] += 5
+        return False
+
+    assert poll_until(slow_false, 2, final_check=True) is False
+    assert calls == 1
+
+
+def test_poll_until_fixed_interval(monkeypatch: pytest.MonkeyPatch, fake_clock):
+    sleeps = _record_sleeps(monkeypatch, fake_clock)
+    assert poll_until(lambda: False, 6, initial=2, cap=2, factor=1.0) is False
+    assert sleeps == pytest.approx([2, 2, 2])
+
+
+def test_poll_until_subtracts_predicate_time_from_delay(monkeypatch: pytest.MonkeyPatch, fake_clock):
+    sleeps = _record_sleeps(monkeypatch, fake_clock)
+
+    def slow_false() -> bool:
+        fake_clock["now"] += 1.5
+        return False
+
+    assert poll_until(slow_false, 5, initial=2, cap=2, factor=1.0) is False
+    assert sleeps == pytest.approx([0.5, 0.5])
@@ -41,3 +41,27 @@ def test_update_formula_file_writes_formula(tmp_path: Path) -> None:
     content = formula_path.read_text(encoding="utf-8")
     assert content.startswith("class Clawbox < Formula")
     assert 'version "1.0.0"' in content
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "g" * 64,
+        "ab " * 21 + "a",
+        "٠" * 64,
+        "a" * 63,
+    ],
+)
+def test_validate_sha256_rejects_non_hex_tokens(value: str) -> None:
+    with pytest.raises(release_formula.ReleaseFormulaError, match="Invalid sha256"):
+        release_formula.validate_sha256(value)
+
+
+def test_validate_sha256_normalizes_case_and_whitespace() -> None:
+    assert release_formula.validate_sha256(f"  {'AB' * 32}\n") == "ab" * 32
+
+
+def test_render_formula_keeps_ruby_interpolation_literal() -> None:
+    rendered = release_formula.render_formula("v1.2.3", "a" * 64)
+    assert 'shell_output("#{bin}/clawbox --help")' in rendered
+    assert rendered.endswith("end\n")
@@ -59,3 +59,32 @@ def test_validate_release_metadata_rejects_missing_changelog_section(tmp_path: P
 def test_validate_version_tag_rejects_non_semver_tag() -> None:
     with pytest.raises(release_meta.ReleaseMetaError, match="Invalid version tag"):
         release_meta.validate_version_tag("1.0.0")
+
+
+def test_read_project_version_ignores_other_sections(tmp_path: Path) -> None:
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text(
+        '[tool.other]\nversion = "9.9.9"\n\n[project]\nname = "clawbox"\nversion = "1.2.3"\n\n'
+        '[project.urls]\nversion = "0.0.0"\n',
+        encoding="utf-8",
+    )
+    assert release_meta.read_project_version(pyproject) == "1.2.3"
+
+    pyproject.write_text('[project]\nname = "clawbox"\n\n[tool.other]\nversion = "9.9.9"\n', encoding="utf-8")
+    with pytest.raises(release_meta.ReleaseMetaError, match=r"Could not read \[project\].version"):
+        release_meta.read_project_version(pyproject)
+
+
+def test_extract_changelog_section_reads_last_section_to_end(tmp_path: Path) -> None:
+    changelog = tmp_path / "CHANGELOG.md"
+    changelog.write_text("# Changelog\n\n## v1.0.1\n\n- Fix.\n\n## v1.0.0\n\n- Initial.\n", encoding="utf-8")
+    assert release_meta.extract_changelog_section("v1.0.0", changelog) == "## v1.0.0\n\n- Initial.\n"
+
+
+def test_extract_changelog_section_matches_exact_heading_only(tmp_path: Path) -> None:
+    changelog = tmp_path / "CHANGELOG.md"
+    changelog.write_text(
+        "# Changelog\n\n## v1.0.0-rc1\n\n- Candidate.\n\n  ## v1.0.0\n\n- Final.\n## v0.9.0\n\n- Previous.\n",
+        encoding="utf-8",
+    )
+    assert release_meta.extract_changelog_section("v1.0.0", changelog) == "## v1.0.0\n\n- Final.\n"
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import pytest
+
+from clawbox.scalar_parsing import parse_scalar, strip_inline_comment
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("plain # comment", "plain "),
+        ("'quoted # not comment' # comment", "'quoted # not comment' "),
+        ('"it\'s # still quoted" # comment', '"it\'s # still quoted" '),
+        ("'unterminated # stays", "'unterminated # stays"),
+        ("no comment", "no comment"),
+    ],
+)
+def test_strip_inline_comment(value: str, expected: str) -> None:
+    assert strip_inline_comment(value) == expected
+
+
+def test_parse_scalar_skips_comments_and_unquotes() -> None:
+    text = "# vm_password: commented\nother: x\n  vm_password: 'secret' # trailing\nvm_password: later\n"
+    assert parse_scalar(text, "vm_password") == "secret"
+
+
+def test_parse_scalar_requires_exact_key_prefix() -> None:
+    assert parse_scalar("vm_password_old: x\n", "vm_password") == ""
+    assert parse_scalar("vm_password:\n", "vm_password") == ""
+    assert parse_scalar("a.b: dotted\n", "a.b") == "dotted"
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import os
+import time
 from pathlib import Path
 
 import pytest
@@ -51,3 +53,45 @@ def test_parse_vm_password_preserves_hash_inside_quotes() -> None:
 def test_parse_vm_password_strips_hash_comment_outside_quotes() -> None:
     text = 'vm_password: abc123 # trailing comment'
     assert secrets.parse_vm_password(text) == "abc123"
+
+
+def test_read_vm_password_rereads_only_after_file_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = tmp_path / "secrets.yml"
+    path.write_text('vm_password: "first"\n', encoding="utf-8")
+    _settle(path, age_seconds=60)
+    assert secrets.read_vm_password(path) == "first"
+
+    reads: list[Path] = []
+    original_read_text = Path.read_text
+
+    def counting_read_text(self: Path, *args, **kwargs) -> str:
+        reads.append(self)
+        return original_read_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", counting_read_text)
+    assert secrets.read_vm_password(path) == "first"
+    assert reads == []
+
+    path.write_text('vm_password: "second-value"\n', encoding="utf-8")
+    _settle(path, age_seconds=30)
+    assert secrets.read_vm_password(path) == "second-value"
+    assert reads == [path]
+
+
+def test_read_vm_password_does_not_cache_recently_modified_file(tmp_path: Path) -> None:
+    path = tmp_path / "secrets.yml"
+    path.write_text('vm_password: "first"\n', encoding="utf-8")
+    assert secrets.read_vm_password(path) == "first"
+
+    # Same inode, size and mtime, as a coarse-mtime filesystem can report after a quick rewrite.
+    before = path.stat()
+    path.write_text('vm_password: "other"\n', encoding="utf-8")
+    os.utime(path, ns=(before.st_atime_ns, before.st_mtime_ns))
+    assert secrets.read_vm_password(path) == "other"
+
+
+def _settle(path: Path, *, age_seconds: int) -> None:
+    stamp = time.time() - age_seconds
+    os.utime(path, (stamp, stamp))
@@ -10,6 +10,11 @@ def test_enabled_optional_service_keys_tracks_enabled_flags() -> None:
         enable_signal_cli=True,
     )
     assert enabled == {services.SERVICE_PLAYWRIGHT, services.SERVICE_SIGNAL_CLI}
+    assert enabled is services.enabled_optional_service_keys(
+        enable_playwright=True,
+        enable_tailscale=False,
+        enable_signal_cli=True,
+    )
 
 
 def test_unsupported_optional_services_returns_empty_for_standard_profile() -> None:
@@ -20,3 +25,8 @@ def test_unsupported_optional_services_returns_empty_for_standard_profile() -> N
     )
     assert services.unsupported_optional_services("standard", enabled) == []
 
+
+def test_unsupported_optional_services_lists_enabled_specs_for_other_profiles() -> None:
+    enabled = {services.SERVICE_TAILSCALE, services.SERVICE_PLAYWRIGHT, "not-a-service"}
+    unsupported = services.unsupported_optional_services("minimal", enabled)
+    assert [spec.key for spec in unsupported] == [services.SERVICE_PLAYWRIGHT, services.SERVICE_TAILSCALE]
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import dataclasses
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from clawbox.state import ProvisionMarker, current_utc_timestamp
+
+
+def _marker(profile: str = "developer") -> ProvisionMarker:
+    return ProvisionMarker(
+        vm_name="clawbox-91",
+        profile=profile,
+        playwright=True,
+        tailscale=False,
+        signal_cli=False,
+        signal_payload=True,
+        provisioned_at="2026-01-01T00:00:00Z",
+    )
+
+
+def test_provision_marker_round_trips_through_file(tmp_path: Path) -> None:
+    marker_file = tmp_path / "clawbox-91.provisioned"
+    marker = _marker()
+    marker.write(marker_file)
+    assert ProvisionMarker.from_file(marker_file) == marker
+
+
+def test_provision_marker_from_file_missing_returns_none(tmp_path: Path) -> None:
+    assert ProvisionMarker.from_file(tmp_path / "absent.provisioned") is None
+
+
+def test_provision_marker_from_file_rereads_only_after_file_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    marker_file = tmp_path / "clawbox-91.provisioned"
+    _marker(profile="standard").write(marker_file)
+    _settle(marker_file, age_seconds=60)
+    assert ProvisionMarker.from_file(marker_file) == _marker(profile="standard")
+
+    reads: list[Path] = []
+    original_read_text = Path.read_text
+
+    def counting_read_text(self: Path, *args, **kwargs) -> str:
+        reads.append(self)
+        return original_read_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", counting_read_text)
+    assert ProvisionMarker.from_file(marker_file) == _marker(profile="standard")
+    assert reads == []
+
+    _marker(profile="developer-extended").write(marker_file)
+    _settle(marker_file, age_seconds=30)
+    assert ProvisionMarker.from_file(marker_file) == _marker(profile="developer-extended")
+    assert reads == [marker_file]
+
+
+def test_provision_marker_from_file_does_not_cache_recently_modified_file(tmp_path: Path) -> None:
+    marker_file = tmp_path / "clawbox-91.provisioned"
+    _marker(profile="standard").write(marker_file)
+    assert ProvisionMarker.from_file(marker_file) == _marker(profile="standard")
+
+    # Same inode, size and mtime, as a coarse-mtime filesystem can report after a quick rewrite.
+    before = marker_file.stat()
+    marker_file.write_text(marker_file.read_text(encoding="utf-8").replace("standard", "advanced"), encoding="utf-8")
+    os.utime(marker_file, ns=(before.st_atime_ns, before.st_mtime_ns))
+    assert ProvisionMarker.from_file(marker_file) == _marker(profile="advanced")
+
+
+def test_provision_marker_is_immutable() -> None:
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        setattr(_marker(), "profile", "standard")
+
+
+def test_provision_marker_from_text_ignores_lines_without_separator() -> None:
+    marker = ProvisionMarker.from_text("garbage\nprofile: developer\nplaywright: yes\nprovisioned_at: 12:00\n")
+    assert marker is not None
+    assert marker.profile == "developer"
+    assert marker.playwright is False
+    assert marker.provisioned_at == "12:00"
+    assert ProvisionMarker.from_text("no separators here\n") is None
+
+
+def test_provision_marker_write_replaces_file_atomically(tmp_path: Path) -> None:
+    marker_file = tmp_path / "state" / "clawbox-91.provisioned"
+    _marker().write(marker_file)
+    _marker(profile="standard").write(marker_file)
+    assert marker_file.read_text(encoding="utf-8").splitlines()[1] == "profile: standard"
+    assert sorted(path.name for path in marker_file.parent.iterdir()) == ["clawbox-91.provisioned"]
+
+
+def test_current_utc_timestamp_is_iso8601_utc() -> None:
+    stamp = current_utc_timestamp()
+    assert datetime.strptime(stamp, "%Y-%m-%dT%H:%M:%SZ").year >= 2024
+
+
+def _settle(path: Path, *, age_seconds: int) -> None:
+    stamp = time.time() - age_seconds
+    os.utime(path, (stamp, stamp))
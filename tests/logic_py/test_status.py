@@ -1,15 +1,16 @@
 from __future__ import annotations
 
-import io
 import json
+import os
 import subprocess
-from contextlib import redirect_stdout
+import time
 from pathlib import Path
 
 import pytest
 
 from clawbox import status as status_ops
 from clawbox.state import ProvisionMarker
+from clawbox.tart import TartClient
 
 
 MUTAGEN_FIXTURES_DIR = Path(__file__).resolve().parents[1] / "fixtures" / "mutagen"
@@ -18,26 +19,26 @@ MUTAGEN_FIXTURES_DIR = Path(__file__).resolve().parents[1] / "fixtures" / "mutag
 class FakeTart:
     def __init__(self, vms: list[dict[str, object]]):
         self.vms = vms
+        named = [vm for vm in vms if isinstance(vm.get("Name"), str)]
+        self._running = {vm["Name"]: vm.get("Running") is True for vm in named}
+        self._ips = {
+            vm["Name"]: vm["IP"] for vm in named if vm.get("Running") is True and isinstance(vm.get("IP"), str)
+        }
 
     def list_vms_json(self) -> list[dict[str, object]]:
         return self.vms
 
+    def list_snapshot(self) -> dict[str, dict[str, object]]:
+        return {vm["Name"]: vm for vm in self.vms if isinstance(vm.get("Name"), str)}
+
     def vm_exists(self, vm_name: str) -> bool:
-        return any(vm.get("Name") == vm_name for vm in self.vms)
+        return vm_name in self._running
 
     def vm_running(self, vm_name: str) -> bool:
-        for vm in self.vms:
-            if vm.get("Name") == vm_name:
-                running = vm.get("Running")
-                return bool(running) if isinstance(running, bool) else False
-        return False
+        return self._running.get(vm_name, False)
 
     def ip(self, vm_name: str) -> str | None:
-        for vm in self.vms:
-            if vm.get("Name") == vm_name and self.vm_running(vm_name):
-                ip = vm.get("IP")
-                return ip if isinstance(ip, str) else None
-        return None
+        return self._ips.get(vm_name)
 
 
 def _context(tmp_path: Path) -> status_ops.StatusContext:
@@ -53,13 +54,6 @@ def _context(tmp_path: Path) -> status_ops.StatusContext:
     )
 
 
-def _capture(fn) -> str:
-    buf = io.StringIO()
-    with redirect_stdout(buf):
-        fn()
-    return buf.getvalue()
-
-
 def _mutagen_fixture(name: str) -> str:
     return (MUTAGEN_FIXTURES_DIR / name).read_text(encoding="utf-8")
 
@@ -71,6 +65,54 @@ def test_parse_mount_statuses_tolerates_blank_lines() -> None:
     assert statuses["/b"] == "unknown"
 
 
+def test_parse_mount_statuses_strips_quotes_and_ignores_unknown_tokens() -> None:
+    paths = ["/a", "/b", "/c"]
+    stdout = "'/a'=dir\n\"/b\"=bogus\n/unrelated=mounted\nrc=0 >>\n"
+    statuses = status_ops.parse_mount_statuses(stdout, paths)
+    assert statuses == {"/a": "dir", "/b": "unknown", "/c": "unknown"}
+
+
+def test_parse_mount_statuses_matches_spaced_paths_inside_wrapped_lines() -> None:
+    paths = ["/Users/me/My Dir", "/b"]
+    statuses = status_ops.parse_mount_statuses("x /Users/me/My Dir=mounted /b=dir\n", paths)
+    assert statuses == {"/Users/me/My Dir": "mounted", "/b": "dir"}
+
+
+def test_parse_mount_statuses_stops_once_every_path_is_resolved() -> None:
+    stdout = "/a=mounted\n/b=dir\n/a=missing\n"
+    assert status_ops.parse_mount_statuses(stdout, ["/a", "/b"]) == {"/a": "mounted", "/b": "dir"}
+
+
+def test_parse_mount_statuses_later_lines_win_until_every_path_is_resolved() -> None:
+    stdout = "/a=dir\n/a=mounted\n/b=dir\n"
+    assert status_ops.parse_mount_statuses(stdout, ["/a", "/b"]) == {"/a": "mounted", "/b": "dir"}
+
+
+def test_build_mount_status_command_reuses_rendering_for_equal_path_sets() -> None:
+    paths = ["/Users/Shared/clawbox-sync/openclaw-source", "/tmp/with space"]
+    command = status_ops.build_mount_status_command(paths)
+    assert "'/tmp/with space'" in command
+    assert command.count("/sbin/mount") == 1
+    assert status_ops.build_mount_status_command(tuple(paths)) is command
+
+
+def test_build_mount_status_command_reports_each_path_from_one_mount_listing(tmp_path: Path) -> None:
+    mounted = tmp_path / "mounted"
+    plain_dir = tmp_path / "plain dir"
+    plain_dir.mkdir()
+    missing = tmp_path / "missing"
+    paths = [str(mounted), str(plain_dir), str(missing)]
+    command = status_ops.build_mount_status_command(paths).replace(
+        "/sbin/mount 2>/dev/null", f"printf '%s\\n' 'fs on {mounted} (apfs, local)'"
+    )
+    proc = subprocess.run(["sh", "-c", command], check=True, capture_output=True, text=True)
+    assert status_ops.parse_mount_statuses(proc.stdout, paths) == {
+        str(mounted): "mounted",
+        str(plain_dir): "dir",
+        str(missing): "missing",
+    }
+
+
 def test_format_mount_statuses_outputs_lines() -> None:
     rendered = status_ops.format_mount_statuses({"/a": "mounted", "/b": "dir"})
     assert "/a: mounted" in rendered
@@ -202,11 +244,26 @@ def test_summarize_mutagen_status_treats_unstructured_nonempty_output_as_active(
     assert lines == ["unexpected mutagen output line", "another diagnostic line"]
 
 
-def test_render_status_report_text_unavailable_branches(tmp_path: Path) -> None:
-    marker_file = tmp_path / "state" / "clawbox-91.provisioned"
-    marker_file.parent.mkdir(parents=True, exist_ok=True)
-    marker_file.write_text("profile: developer\n", encoding="utf-8")
+def test_summarize_mutagen_status_caps_summary_and_detects_empty_listing() -> None:
+    output = "\n".join(["-" * 20] + [f"Name: session-{index}\nStatus: Watching" for index in range(4)])
+    active, lines = status_ops._summarize_mutagen_status(output)
+    assert active is True
+    assert lines == [
+        "Name: session-0",
+        "Status: Watching",
+        "Name: session-1",
+        "Status: Watching",
+        "Name: session-2",
+        "Status: Watching",
+    ]
+    assert status_ops._summarize_mutagen_status("----\n\n  ---  \n") == (False, ["no active sessions found"])
+    assert status_ops._summarize_mutagen_status("banner\nNo synchronization sessions found\n") == (
+        False,
+        ["no active sessions found"],
+    )
 
+
+def test_render_status_report_text_unavailable_branches(capsys) -> None:
     marker = ProvisionMarker(
         vm_name="clawbox-91",
         profile="developer",
@@ -229,16 +286,13 @@ def test_render_status_report_text_unavailable_branches(tmp_path: Path) -> None:
             lines=[],
         ),
     )
-    out = _capture(lambda: status_ops._render_status_report_text("clawbox-91", marker_file, marker, report))
+    status_ops._render_status_report_text("clawbox-91", marker, report)
+    out = capsys.readouterr().out
     assert "sync paths: unavailable" in out
     assert "signal payload sync daemon:" not in out
 
 
-def test_render_status_report_text_does_not_render_signal_daemon_section(tmp_path: Path) -> None:
-    marker_file = tmp_path / "state" / "clawbox-91.provisioned"
-    marker_file.parent.mkdir(parents=True, exist_ok=True)
-    marker_file.write_text("profile: developer\n", encoding="utf-8")
-
+def test_render_status_report_text_does_not_render_signal_daemon_section(capsys) -> None:
     report = status_ops.VMStatusReport(
         vm="clawbox-91",
         exists=True,
@@ -251,7 +305,8 @@ def test_render_status_report_text_does_not_render_signal_daemon_section(tmp_pat
             lines=[],
         ),
     )
-    out = _capture(lambda: status_ops._render_status_report_text("clawbox-91", marker_file, None, report))
+    status_ops._render_status_report_text("clawbox-91", None, report)
+    out = capsys.readouterr().out
     assert "signal payload sync daemon:" not in out
 
 
@@ -276,7 +331,9 @@ def test_status_mount_paths_marker_missing_skips_remote_probe(tmp_path: Path) ->
     assert note == "no marker found; skipping remote sync-path probe"
 
 
-def test_status_vm_no_marker_does_not_call_remote_probe(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+def test_status_vm_no_marker_does_not_call_remote_probe(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys
+) -> None:
     ctx = _context(tmp_path)
     tart = FakeTart([{"Name": "clawbox-91", "Running": True, "IP": "192.168.64.10"}])
     called = {"probe": 0}
@@ -286,13 +343,23 @@ def test_status_vm_no_marker_does_not_call_remote_probe(tmp_path: Path, monkeypa
         lambda *_args, **_kwargs: called.__setitem__("probe", called["probe"] + 1) or ("ok", {}),
     )
 
-    out = _capture(lambda: status_ops.status_vm(91, tart, as_json=False, context=ctx))
+    status_ops.status_vm(91, tart, as_json=False, context=ctx)
+    out = capsys.readouterr().out
     assert called["probe"] == 0
     assert "no marker found; skipping remote sync-path probe" in out
 
 
+def test_status_vm_reports_unparseable_marker_as_present(tmp_path: Path, capsys) -> None:
+    ctx = _context(tmp_path)
+    ctx.state_dir.mkdir(parents=True, exist_ok=True)
+    (ctx.state_dir / "clawbox-92.provisioned").write_text("not a marker\n", encoding="utf-8")
+    status_ops.status_vm(92, FakeTart([]), as_json=True, context=ctx)
+    payload = json.loads(capsys.readouterr().out)
+    assert payload["provision_marker"] == {"present": True, "data": None}
+
+
 def test_status_vm_warns_when_mutagen_sessions_missing(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys
 ) -> None:
     ctx = _context(tmp_path)
     ctx.state_dir.mkdir(parents=True, exist_ok=True)
@@ -332,7 +399,8 @@ def test_status_vm_warns_when_mutagen_sessions_missing(
         lambda _vm_name: _mutagen_fixture("sync-list-no-sessions.txt"),
     )
 
-    out = _capture(lambda: status_ops.status_vm(91, tart, as_json=True, context=ctx))
+    status_ops.status_vm(91, tart, as_json=True, context=ctx)
+    out = capsys.readouterr().out
     payload = json.loads(out)
     assert payload["mutagen_sync"]["enabled"] is True
     assert payload["mutagen_sync"]["probe"] == "ok"
@@ -341,17 +409,18 @@ def test_status_vm_warns_when_mutagen_sessions_missing(
     assert any("no active Mutagen sessions were found" in warning for warning in payload["warnings"])
 
 
-def test_status_environment_json_no_vms(tmp_path: Path) -> None:
+def test_status_environment_json_no_vms(tmp_path: Path, capsys) -> None:
     ctx = _context(tmp_path)
     tart = FakeTart([])
-    out = _capture(lambda: status_ops.status_environment(tart, as_json=True, context=ctx))
+    status_ops.status_environment(tart, as_json=True, context=ctx)
+    out = capsys.readouterr().out
     payload = json.loads(out)
     assert payload["mode"] == "environment"
     assert payload["vm_count"] == 0
     assert payload["vms"] == []
 
 
-def test_status_environment_text_includes_vm_sections(tmp_path: Path) -> None:
+def test_status_environment_text_includes_vm_sections(tmp_path: Path, capsys) -> None:
     ctx = _context(tmp_path)
     ctx.state_dir.mkdir(parents=True, exist_ok=True)
     marker = ProvisionMarker(
@@ -365,7 +434,89 @@ def test_status_environment_text_includes_vm_sections(tmp_path: Path) -> None:
     )
     marker.write(ctx.state_dir / "clawbox-92.provisioned")
     tart = FakeTart([{"Name": "clawbox-92", "Running": False}])
-    out = _capture(lambda: status_ops.status_environment(tart, as_json=False, context=ctx))
+    status_ops.status_environment(tart, as_json=False, context=ctx)
+    out = capsys.readouterr().out
     assert "Clawbox environment:" in out
     assert "VM: clawbox-92" in out
     assert "vms discovered: 1" in out
+
+
+def test_status_environment_json_keeps_vm_order_across_workers(tmp_path: Path, capsys) -> None:
+    ctx = _context(tmp_path)
+    tart = FakeTart(
+        [
+            {"Name": "clawbox-95", "Running": False},
+            {"Name": "clawbox-93", "Running": False},
+            {"Name": "clawbox-94", "Running": False},
+        ]
+    )
+    status_ops.status_environment(tart, as_json=True, context=ctx)
+    out = capsys.readouterr().out
+    payload = json.loads(out)
+    assert [vm["vm"] for vm in payload["vms"]] == ["clawbox-93", "clawbox-94", "clawbox-95"]
+
+
+def test_status_environment_lists_tart_vms_once(tmp_path: Path, capsys) -> None:
+    ctx = _context(tmp_path)
+
+    class CountingTart(TartClient):
+        list_calls = 0
+
+        def list_vms_json(self) -> list[dict[str, object]]:
+            self.list_calls += 1
+            return [{"Name": "clawbox-93", "Running": False}, {"Name": "clawbox-94", "Running": False}]
+
+        def ip(self, vm_name: str) -> str | None:
+            return None
+
+    tart = CountingTart()
+    status_ops.status_environment(tart, as_json=True, context=ctx)
+    out = capsys.readouterr().out
+    payload = json.loads(out)
+    assert [vm["exists"] for vm in payload["vms"]] == [True, True]
+    assert tart.list_calls == 1
+
+
+def test_status_vm_reads_secrets_once_across_vms(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    ctx = _context(tmp_path)
+    ctx.secrets_file.parent.mkdir(parents=True, exist_ok=True)
+    ctx.secrets_file.write_text('vm_password: "shared-secret"\n', encoding="utf-8")
+    settled = time.time() - 60
+    os.utime(ctx.secrets_file, (settled, settled))
+    vms: list[dict[str, object]] = []
+    for vm_name in ("clawbox-93", "clawbox-94"):
+        ProvisionMarker(
+            vm_name=vm_name,
+            profile="developer",
+            playwright=False,
+            tailscale=False,
+            signal_cli=False,
+            signal_payload=False,
+            provisioned_at="2026-01-01T00:00:00Z",
+        ).write(ctx.state_dir / f"{vm_name}.provisioned")
+        vms.append({"Name": vm_name, "Running": True, "IP": "192.168.64.10"})
+
+    monkeypatch.setattr(status_ops, "mutagen_available", lambda: False)
+    users: list[tuple[str, str]] = []
+
+    def fake_shell(vm_name: str, _cmd: str, *, ansible_user: str, ansible_password: str, **_kwargs):
+        users.append((ansible_user, ansible_password))
+        return subprocess.CompletedProcess(args=["ansible"], returncode=0, stdout="", stderr="")
+
+    monkeypatch.setattr(status_ops, "_ansible_shell", fake_shell)
+    reads: list[Path] = []
+    original_read_text = Path.read_text
+
+    def counting_read_text(self: Path, *args, **kwargs) -> str:
+        if self == ctx.secrets_file:
+            reads.append(self)
+        return original_read_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", counting_read_text)
+    tart = FakeTart(vms)
+    for vm_number in (93, 94):
+        status_ops.status_vm(vm_number, tart, as_json=True, context=ctx)
+    assert sorted(users) == [("clawbox-93", "shared-secret"), ("clawbox-94", "shared-secret")]
+    assert len(reads) == 1
@@ -7,7 +7,7 @@ from pathlib import Path
 import pytest
 
 from clawbox import tart as tart_mod
-from clawbox.tart import TartClient, TartError, wait_for_vm_running
+from clawbox.tart import TartClient, TartError, VmState, classify_vm_state, wait_for_vm_running
 
 
 def _cp(*, args: list[str], rc: int = 0, stdout: str = "", stderr: str = "") -> subprocess.CompletedProcess[str]:
@@ -136,21 +136,99 @@ def test_run_in_background_maps_errors(monkeypatch: pytest.MonkeyPatch, tmp_path
         client.run_in_background("clawbox-91", [], tmp_path / "launch.log")
 
 
-def test_wait_for_vm_running_success_and_timeout(monkeypatch: pytest.MonkeyPatch):
+def test_wait_for_vm_running_success_and_timeout(fake_clock):
     class FakeTart:
         def __init__(self):
             self.calls = 0
 
+        def invalidate(self) -> None:
+            pass
+
         def vm_running(self, _vm_name: str) -> bool:
             self.calls += 1
             return self.calls >= 2
 
     tart = FakeTart()
-    monkeypatch.setattr(tart_mod.time, "sleep", lambda *_args, **_kwargs: None)
     assert wait_for_vm_running(tart, "clawbox-91", timeout_seconds=3, poll_seconds=1) is True
 
     class AlwaysOffTart:
+        def invalidate(self) -> None:
+            pass
+
         def vm_running(self, _vm_name: str) -> bool:
             return False
 
     assert wait_for_vm_running(AlwaysOffTart(), "clawbox-91", timeout_seconds=1, poll_seconds=1) is False
+
+
+def test_wait_for_vm_running_sees_state_change_within_snapshot_ttl(
+    monkeypatch: pytest.MonkeyPatch, fake_clock
+):
+    client = TartClient()
+    listings = iter([[{"Name": "clawbox-91", "Running": False}], [{"Name": "clawbox-91", "Running": True}]])
+    monkeypatch.setattr(client, "list_vms_json", lambda: next(listings))
+    assert client.vm_running("clawbox-91") is False
+    assert wait_for_vm_running(client, "clawbox-91", timeout_seconds=1, poll_seconds=1) is True
+
+
+def test_vm_checks_share_one_tart_list_until_invalidated(monkeypatch: pytest.MonkeyPatch):
+    client = TartClient()
+    calls: list[list[str]] = []
+    running = {"value": True}
+
+    def fake_run(args, **kwargs):
+        calls.append(list(args))
+        if args[:2] == ["tart", "list"]:
+            return _cp(args=args, stdout=json.dumps([{"Name": "clawbox-91", "Running": running["value"]}]))
+        return _cp(args=args)
+
+    monkeypatch.setattr(client, "_run", fake_run)
+    assert client.vm_exists("clawbox-91") is True
+    assert client.vm_running("clawbox-91") is True
+    assert client.vm_exists("clawbox-92") is False
+    assert sum(1 for call in calls if call[:2] == ["tart", "list"]) == 1
+
+    running["value"] = False
+    client.stop("clawbox-91")
+    assert client.vm_running("clawbox-91") is False
+    assert sum(1 for call in calls if call[:2] == ["tart", "list"]) == 2
+
+
+class _StateTart:
+    def __init__(self, exists: bool, running: bool):
+        self.exists = exists
+        self.running = running
+        self.running_calls = 0
+
+    def vm_exists(self, _vm_name: str) -> bool:
+        return self.exists
+
+    def vm_running(self, _vm_name: str) -> bool:
+        self.running_calls += 1
+        return self.running
+
+
+@pytest.mark.parametrize(
+    ("exists", "running", "expected"),
+    [
+        (False, False, VmState.ABSENT),
+        (True, False, VmState.STOPPED),
+        (True, True, VmState.RUNNING),
+    ],
+)
+def test_classify_vm_state(exists: bool, running: bool, expected: VmState) -> None:
+    assert classify_vm_state(_StateTart(exists, running), "clawbox-91") is expected
+
+
+def test_classify_vm_state_skips_running_check_for_absent_vm() -> None:
+    tart = _StateTart(exists=False, running=True)
+    assert classify_vm_state(tart, "clawbox-91") is VmState.ABSENT
+    assert tart.running_calls == 0
+
+
+def test_tart_vm_dir_honors_tart_home(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    monkeypatch.setenv("TART_HOME", str(tmp_path / "tart-home"))
+    assert tart_mod.tart_vm_dir("clawbox-91") == tmp_path / "tart-home" / "vms" / "clawbox-91"
+    monkeypatch.delenv("TART_HOME")
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    assert tart_mod.tart_vm_dir("clawbox-91") == tmp_path / "home" / ".tart" / "vms" / "clawbox-91"
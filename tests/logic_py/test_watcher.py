@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 import json
+import os
 import subprocess
 import signal
+import sys
+import threading
+import time
 from pathlib import Path
 
 import pytest
@@ -20,6 +24,11 @@ class _Proc:
     def poll(self):
         return self._poll_value
 
+    def wait(self, timeout: float | None = None):
+        if self._poll_value is None:
+            raise subprocess.TimeoutExpired("watcher", timeout)
+        return self._poll_value
+
 
 def _record_path(state_dir: Path, vm_name: str) -> Path:
     return state_dir / "watchers" / f"{vm_name}.json"
@@ -135,7 +144,7 @@ def test_reconcile_vm_watchers_stops_dead_vm_watchers(
     stopped: list[str] = []
     cleaned: list[str] = []
     monkeypatch.setattr(watcher_mod, "_pid_running", lambda _pid: True)
-    monkeypatch.setattr(watcher_mod, "stop_vm_watcher", lambda _state_dir, name: stopped.append(name) or True)
+    monkeypatch.setattr(watcher_mod, "stop_vm_watchers", lambda _state_dir, names: stopped.extend(names) or names)
     monkeypatch.setattr(watcher_mod, "cleanup_locks_for_vm", lambda name: cleaned.append(name))
 
     watcher_mod.reconcile_vm_watchers(_Tart(), tmp_path)
@@ -143,6 +152,38 @@ def test_reconcile_vm_watchers_stops_dead_vm_watchers(
     assert cleaned == [vm_name]
 
 
+def test_reconcile_vm_watchers_queries_all_vms_before_stopping(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    names = ["clawbox-94", "clawbox-95"]
+    for index, name in enumerate(names):
+        record_file = _record_path(tmp_path, name)
+        record_file.parent.mkdir(parents=True, exist_ok=True)
+        record_file.write_text(
+            json.dumps({"vm_name": name, "pid": 4000 + index, "poll_seconds": 2, "started_at": "x"}) + "\n",
+            encoding="utf-8",
+        )
+
+    events: list[tuple[str, str]] = []
+
+    class _Tart:
+        def vm_running(self, vm_name: str) -> bool:
+            events.append(("query", vm_name))
+            return False
+
+    monkeypatch.setattr(watcher_mod, "_pid_running", lambda _pid: True)
+    monkeypatch.setattr(
+        watcher_mod,
+        "stop_vm_watchers",
+        lambda _state_dir, names: events.extend(("stop", name) for name in names) or names,
+    )
+    monkeypatch.setattr(watcher_mod, "cleanup_locks_for_vm", lambda _name: None)
+
+    watcher_mod.reconcile_vm_watchers(_Tart(), tmp_path)
+    assert sorted(events[:2]) == [("query", name) for name in names]
+    assert sorted(events[2:]) == [("stop", name) for name in names]
+
+
 def test_run_vm_watcher_loop_cleans_locks_and_removes_own_record(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -216,6 +257,7 @@ def test_pid_cmdline_and_is_watcher_pid_fallbacks(monkeypatch: pytest.MonkeyPatc
     assert watcher_mod._pid_cmdline(101) == ""
 
     monkeypatch.setattr(watcher_mod, "_pid_running", lambda _pid: True)
+    monkeypatch.setattr(watcher_mod, "_proc_cmdline", lambda _pid: None)
     monkeypatch.setattr(
         watcher_mod.subprocess,
         "run",
@@ -241,6 +283,20 @@ def test_signal_watcher_pid_error_branches(monkeypatch: pytest.MonkeyPatch) -> N
     watcher_mod._signal_watcher_pid(1234, signal.SIGTERM)
 
 
+def test_signal_watcher_pid_skips_direct_kill_for_group_leader(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[tuple[str, int]] = []
+    monkeypatch.setattr(watcher_mod.os, "getpgid", lambda pid: pid if pid == 1234 else 777)
+    monkeypatch.setattr(watcher_mod.os, "killpg", lambda pgid, _sig: calls.append(("killpg", pgid)))
+    monkeypatch.setattr(watcher_mod.os, "kill", lambda pid, _sig: calls.append(("kill", pid)))
+
+    watcher_mod._signal_watcher_pid(1234, signal.SIGTERM)
+    assert calls == [("killpg", 1234)]
+
+    calls.clear()
+    watcher_mod._signal_watcher_pid(4321, signal.SIGTERM)
+    assert calls == [("killpg", 777), ("kill", 4321)]
+
+
 def test_start_vm_watcher_rejects_nonpositive_poll_seconds(tmp_path: Path) -> None:
     with pytest.raises(watcher_mod.WatcherError, match="poll_seconds must be > 0"):
         watcher_mod.start_vm_watcher(tmp_path, "clawbox-91", poll_seconds=0)
@@ -308,6 +364,42 @@ def test_stop_vm_watcher_escalates_to_sigkill(
     assert seen_signals == [signal.SIGTERM, signal.SIGKILL]
 
 
+def test_stop_vm_watchers_signals_all_before_waiting(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    names = ["clawbox-96", "clawbox-97"]
+    for index, name in enumerate(names):
+        record_file = _record_path(tmp_path, name)
+        record_file.parent.mkdir(parents=True, exist_ok=True)
+        record_file.write_text(
+            json.dumps({"vm_name": name, "pid": 5000 + index, "poll_seconds": 2, "started_at": "x"}) + "\n",
+            encoding="utf-8",
+        )
+
+    events: list[tuple[str, int]] = []
+    monkeypatch.setattr(watcher_mod, "_is_watcher_pid", lambda _pid, _vm_name: True)
+    monkeypatch.setattr(
+        watcher_mod, "_signal_watcher_pid", lambda pid, sig: events.append((signal.Signals(sig).name, pid))
+    )
+
+    def _wait(pid: int, timeout_seconds: float) -> bool:
+        events.append(("wait", pid))
+        return pid == 5000
+
+    monkeypatch.setattr(watcher_mod, "_wait_for_pid_exit", _wait)
+
+    stopped = watcher_mod.stop_vm_watchers(tmp_path, [*names, "clawbox-98"], timeout_seconds=0)
+    assert stopped == names
+    assert events == [
+        ("SIGTERM", 5000),
+        ("SIGTERM", 5001),
+        ("wait", 5000),
+        ("wait", 5001),
+        ("SIGKILL", 5001),
+    ]
+    assert not any(_record_path(tmp_path, name).exists() for name in names)
+
+
 def test_reconcile_vm_watchers_handles_invalid_records_and_dead_pids(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -476,3 +568,97 @@ def test_run_vm_watcher_loop_requires_consecutive_not_running_polls(
         ("watcher_teardown_complete", "vm_not_running_confirmed"),
     ]
     assert not record_file.exists()
+
+
+def test_block_until_pid_exit_returns_when_process_exits() -> None:
+    proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(0.2)"])
+    reaper = threading.Thread(target=proc.wait)
+    reaper.start()
+    started = time.monotonic()
+    try:
+        supported = watcher_mod._block_until_pid_exit(proc.pid, 10)
+    finally:
+        reaper.join()
+    if not supported:
+        pytest.skip("no kernel process-exit notification on this platform")
+    assert time.monotonic() - started < 5
+
+
+def test_wait_for_pid_exit_polls_when_exit_notification_unavailable(monkeypatch: pytest.MonkeyPatch) -> None:
+    checks = iter([True, True, False, False])
+    monkeypatch.setattr(watcher_mod, "_pid_running", lambda _pid: next(checks))
+    monkeypatch.setattr(watcher_mod, "_block_until_pid_exit", lambda _pid, _timeout: False)
+    monkeypatch.setattr(watcher_mod.time, "sleep", lambda *_args, **_kwargs: None)
+    assert watcher_mod._wait_for_pid_exit(4321, 5) is True
+
+
+def test_proc_cmdline_joins_argv_like_ps() -> None:
+    if not Path("/proc/self/cmdline").exists():
+        pytest.skip("/proc is not available on this platform")
+    proc = subprocess.Popen(
+        [sys.executable, "-c", "import time; time.sleep(5)", "_watch-vm", "clawbox-91"],
+    )
+    deadline = time.monotonic() + 5
+    try:
+        # The child's argv appears once exec completes.
+        cmdline = watcher_mod._proc_cmdline(proc.pid)
+        while cmdline is None or "_watch-vm" not in cmdline:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+            cmdline = watcher_mod._proc_cmdline(proc.pid)
+    finally:
+        proc.kill()
+        proc.wait()
+    assert cmdline is not None
+    assert cmdline.endswith("_watch-vm clawbox-91")
+    assert watcher_mod._proc_cmdline(-1) is None
+
+
+def test_read_record_reparses_only_after_record_is_rewritten(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    record = watcher_mod.WatcherRecord(
+        vm_name="clawbox-91", pid=4242, poll_seconds=2, started_at="2026-01-01T00:00:00Z"
+    )
+    watcher_mod._write_record(tmp_path, record)
+    record_file = _record_path(tmp_path, "clawbox-91")
+    assert watcher_mod._read_record(record_file) == record
+
+    loads: list[str] = []
+    original_loads = watcher_mod.json.loads
+    monkeypatch.setattr(watcher_mod.json, "loads", lambda raw: loads.append(raw) or original_loads(raw))
+    assert watcher_mod._read_record(record_file) == record
+    assert loads == []
+
+    replacement = watcher_mod.WatcherRecord(
+        vm_name="clawbox-91", pid=4343, poll_seconds=2, started_at="2026-01-01T00:00:01Z"
+    )
+    watcher_mod._write_record(tmp_path, replacement)
+    assert watcher_mod._read_record(record_file) == replacement
+    assert len(loads) == 1
+    record_file.unlink()
+    assert watcher_mod._read_record(record_file) is None
+
+
+def test_is_watcher_pid_matches_whole_tokens_only(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        watcher_mod, "_pid_cmdline", lambda _pid: "python -m clawbox.main _watch-vm clawbox-91 --poll-seconds 2"
+    )
+    assert watcher_mod._is_watcher_pid(101, "clawbox-91") is True
+    assert watcher_mod._is_watcher_pid(101, "clawbox") is False
+    assert watcher_mod._is_watcher_pid(101, "_watch") is False
+
+
+def test_read_record_sees_rewrite_with_unchanged_stat(tmp_path: Path) -> None:
+    record = watcher_mod.WatcherRecord(
+        vm_name="clawbox-91", pid=4242, poll_seconds=2, started_at="2026-01-01T00:00:00Z"
+    )
+    watcher_mod._write_record(tmp_path, record)
+    record_file = _record_path(tmp_path, "clawbox-91")
+    assert watcher_mod._read_record(record_file) == record
+
+    # Same inode, size and mtime, as a coarse-mtime filesystem can report after a rewrite.
+    before = record_file.stat()
+    record_file.write_text(record_file.read_text(encoding="utf-8").replace("4242", "4343"), encoding="utf-8")
+    os.utime(record_file, ns=(before.st_atime_ns, before.st_mtime_ns))
+    assert watcher_mod._read_record(record_file).pid == 4343